@@ -5,6 +5,7 @@ import sys
 
 import uvicorn
 
+from edge_mining.adapters.domain.miner.controllers.pyasic import clear_miner_pool
 from edge_mining.adapters.infrastructure.api.main_api import app as fastapi_app
 from edge_mining.adapters.infrastructure.api.setup import init_api_dependencies
 from edge_mining.adapters.infrastructure.cli.main_cli import run_cli
@@ -12,9 +13,9 @@ from edge_mining.adapters.infrastructure.logging.terminal_logging import Termina
 from edge_mining.adapters.infrastructure.sheduler.jobs import AutomationScheduler
 from edge_mining.bootstrap import configure_dependencies
 from edge_mining.shared.infrastructure import ApplicationMode, Services
-from edge_mining.shared.settings.settings import AppSettings
+from edge_mining.shared.settings.settings import get_settings
 
-settings = AppSettings()
+settings = get_settings()
 logger = TerminalLogger(log_level=settings.log_level)
 
 
@@ -90,6 +91,8 @@ def main():
     except Exception as e:
         logger.error(f"Unhandled exception during main execution: {e}")
     finally:
+        # Release the miners discovered by the pyasic controllers
+        clear_miner_pool()
         # Sure to flush logs before exiting
         logger.shutdown()
         sys.exit(1)
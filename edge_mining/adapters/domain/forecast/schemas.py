@@ -1,15 +1,16 @@
 """Validation schemas for forecast domain."""
 
 import uuid
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union, cast
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union, cast
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from edge_mining.domain.common import EntityId, Timestamp, WattHours, Watts
 from edge_mining.domain.forecast.aggregate_root import Forecast
 from edge_mining.domain.forecast.common import ForecastProviderAdapter
 from edge_mining.domain.forecast.entities import ForecastProvider
+from edge_mining.domain.forecast.exceptions import ForecastProviderConfigurationError
 from edge_mining.domain.forecast.value_objects import ForecastInterval, ForecastPowerPoint
 from edge_mining.shared.adapter_configs.forecast import (
     ForecastProviderDummySolarConfig,
@@ -18,6 +19,13 @@ from edge_mining.shared.adapter_configs.forecast import (
 from edge_mining.shared.adapter_maps.forecast import FORECAST_PROVIDER_CONFIG_TYPE_MAP
 from edge_mining.shared.interfaces.config import ForecastProviderConfig
 
+# Bound once so the hot to_model paths skip the global and attribute lookups
+_CONFIG_TYPE_FOR = FORECAST_PROVIDER_CONFIG_TYPE_MAP.get
+
+# Adapter values are static, so build the lookup set and error message once
+_ADAPTER_VALUES: frozenset[str] = frozenset(adapter.value for adapter in ForecastProviderAdapter)
+_ADAPTER_TYPE_ERROR = f"adapter_type must be one of {[adapter.value for adapter in ForecastProviderAdapter]}"
+
 
 class ForecastPowerPointSchema(BaseModel):
     """Schema for ForecastPowerPoint value object."""
@@ -25,18 +33,11 @@ class ForecastPowerPointSchema(BaseModel):
     timestamp: datetime = Field(..., description="Timestamp for the power prediction")
     power: float = Field(..., ge=0, description="Predicted power output in Watts")
 
-    @field_validator("power")
-    @classmethod
-    def validate_power(cls, v: float) -> float:
-        """Validate power is non-negative."""
-        if v < 0:
-            raise ValueError("power must be non-negative")
-        return v
-
     @classmethod
     def from_model(cls, power_point: ForecastPowerPoint) -> "ForecastPowerPointSchema":
         """Create ForecastPowerPointSchema from ForecastPowerPoint value object."""
-        return cls(
+        # Domain value objects are already valid, skip re-validation
+        return cls.model_construct(
             timestamp=power_point.timestamp,
             power=float(power_point.power),
         )
@@ -60,23 +61,23 @@ class ForecastIntervalSchema(BaseModel):
         default_factory=list, description="Power predictions within interval"
     )
 
-    @field_validator("energy", "energy_remaining")
-    @classmethod
-    def validate_energy(cls, v: Optional[float]) -> Optional[float]:
-        """Validate energy values are non-negative if provided."""
-        if v is not None and v < 0:
-            raise ValueError("energy values must be non-negative")
-        return v
-
     @classmethod
     def from_model(cls, interval: ForecastInterval) -> "ForecastIntervalSchema":
         """Create ForecastIntervalSchema from ForecastInterval value object."""
-        return cls(
+        # Intervals can hold hundreds of power points: build them in a single pass
+        # without going through ForecastPowerPointSchema.from_model for each one
+        construct_power_point = ForecastPowerPointSchema.model_construct
+        power_points = [
+            construct_power_point(timestamp=pp.timestamp, power=float(pp.power)) for pp in interval.power_points
+        ]
+
+        # Domain value objects are already valid, skip re-validation
+        return cls.model_construct(
             start=interval.start,
             end=interval.end,
             energy=float(interval.energy) if interval.energy is not None else None,
             energy_remaining=float(interval.energy_remaining) if interval.energy_remaining is not None else None,
-            power_points=[ForecastPowerPointSchema.from_model(pp) for pp in interval.power_points],
+            power_points=power_points,
         )
 
     def to_model(self) -> ForecastInterval:
@@ -93,25 +94,15 @@ class ForecastIntervalSchema(BaseModel):
 class ForecastSchema(BaseModel):
     """Schema for Forecast aggregate root."""
 
-    id: str = Field(..., description="Unique identifier for the forecast")
+    id: uuid.UUID = Field(..., description="Unique identifier for the forecast")
     timestamp: datetime = Field(..., description="When this forecast was generated or last updated")
     intervals: List[ForecastIntervalSchema] = Field(default_factory=list, description="Forecast intervals")
 
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate that id is a valid UUID string."""
-        try:
-            uuid.UUID(v)
-        except ValueError as exc:
-            raise ValueError("id must be a valid UUID string") from exc
-        return v
-
     @classmethod
     def from_model(cls, forecast: Forecast) -> "ForecastSchema":
         """Create ForecastSchema from Forecast aggregate root."""
         return cls(
-            id=str(forecast.id),
+            id=forecast.id,
             timestamp=forecast.timestamp,
             intervals=[ForecastIntervalSchema.from_model(interval) for interval in forecast.intervals],
         )
@@ -119,128 +110,70 @@ class ForecastSchema(BaseModel):
     def to_model(self) -> Forecast:
         """Convert ForecastSchema to Forecast aggregate root."""
         return Forecast(
-            id=EntityId(uuid.UUID(self.id)),
+            id=EntityId(self.id),
             timestamp=Timestamp(self.timestamp),
             intervals=[interval.to_model() for interval in self.intervals],
         )
 
-    @field_serializer("id")
-    def serialize_id(self, value: str) -> str:
-        """Serialize id field."""
-        return str(value)
-
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        arbitrary_types_allowed = True
-        json_encoders = {
-            uuid.UUID: str,
-            datetime: lambda v: v.isoformat(),
-            timedelta: lambda v: v.total_seconds(),
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True, arbitrary_types_allowed=True)
 
 
 class ForecastProviderSchema(BaseModel):
     """Schema for ForecastProvider entity with complete validation."""
 
-    id: str = Field(..., description="Unique identifier for the forecast provider")
+    id: uuid.UUID = Field(..., description="Unique identifier for the forecast provider")
     name: str = Field(default="", description="Forecast provider name")
     adapter_type: ForecastProviderAdapter = Field(
         default=ForecastProviderAdapter.DUMMY_SOLAR, description="Type of forecast provider adapter"
     )
-    config: dict = Field(default={}, description="Forecast provider configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
-
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate that id is a valid UUID string."""
-        try:
-            uuid.UUID(v)
-        except ValueError as exc:
-            raise ValueError("id must be a valid UUID string") from exc
-        return v
+    config: dict = Field(default_factory=dict, description="Forecast provider configuration")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate forecast provider name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
+        return v.strip()
 
     @field_validator("adapter_type")
     @classmethod
     def validate_adapter_type(cls, v: str) -> ForecastProviderAdapter:
         """Validate that adapter_type is a recognized ForecastProviderAdapter."""
-        adapter_values = [adapter.value for adapter in ForecastProviderAdapter]
-        if v not in adapter_values:
-            raise ValueError(f"adapter_type must be one of {adapter_values}")
+        if v not in _ADAPTER_VALUES:
+            raise ValueError(_ADAPTER_TYPE_ERROR)
         return ForecastProviderAdapter(v)
 
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
-
     @classmethod
     def from_model(cls, forecast_provider: ForecastProvider) -> "ForecastProviderSchema":
         """Create ForecastProviderSchema from a ForecastProvider domain model instance."""
-        return cls(
-            id=str(forecast_provider.id),
+        # Domain entities are already valid, skip re-validation. SQLite repositories hand
+        # IDs back as strings, so convert them here since model_construct does not.
+        external_service_id = forecast_provider.external_service_id
+        return cls.model_construct(
+            id=uuid.UUID(str(forecast_provider.id)),
             name=forecast_provider.name,
             adapter_type=forecast_provider.adapter_type,
             config=forecast_provider.config.to_dict() if forecast_provider.config else {},
-            external_service_id=(
-                str(forecast_provider.external_service_id) if forecast_provider.external_service_id else None
-            ),
+            external_service_id=uuid.UUID(str(external_service_id)) if external_service_id else None,
         )
 
-    @field_serializer("id")
-    def serialize_id(self, value: str) -> str:
-        """Serialize id field."""
-        return str(value)
-
-    @field_serializer("external_service_id")
-    def serialize_external_service_id(self, value: Optional[str]) -> Optional[str]:
-        """Serialize external_service_id field."""
-        return str(value) if value is not None else None
-
     def to_model(self) -> ForecastProvider:
         """Convert ForecastProviderSchema to ForecastProvider domain model instance."""
         configuration: Optional[ForecastProviderConfig] = None
         if self.config:
-            config_class = FORECAST_PROVIDER_CONFIG_TYPE_MAP.get(self.adapter_type, None)
+            config_class = _CONFIG_TYPE_FOR(self.adapter_type)
             if config_class:
                 configuration = cast(ForecastProviderConfig, config_class.from_dict(self.config))
 
         return ForecastProvider(
-            id=EntityId(uuid.UUID(self.id)),
+            id=EntityId(self.id),
             name=self.name,
             adapter_type=self.adapter_type,
             config=configuration,
-            external_service_id=EntityId(uuid.UUID(self.external_service_id)) if self.external_service_id else None,
+            external_service_id=EntityId(self.external_service_id) if self.external_service_id else None,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        arbitrary_types_allowed = True
-        json_encoders = {
-            uuid.UUID: str,
-            ForecastProviderAdapter: lambda v: v.value,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True, arbitrary_types_allowed=True)
 
 
 class ForecastProviderCreateSchema(BaseModel):
@@ -251,62 +184,37 @@ class ForecastProviderCreateSchema(BaseModel):
         default=ForecastProviderAdapter.DUMMY_SOLAR, description="Type of forecast provider adapter"
     )
     config: Optional[dict] = Field(default=None, description="Forecast provider configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate forecast provider name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
+        return v.strip()
 
     @field_validator("adapter_type")
     @classmethod
     def validate_adapter_type(cls, v: str) -> ForecastProviderAdapter:
         """Validate that adapter_type is a recognized ForecastProviderAdapter."""
-        adapter_values = [adapter.value for adapter in ForecastProviderAdapter]
-        if v not in adapter_values:
-            raise ValueError(f"adapter_type must be one of {adapter_values}")
+        if v not in _ADAPTER_VALUES:
+            raise ValueError(_ADAPTER_TYPE_ERROR)
         return ForecastProviderAdapter(v)
 
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
-
     def to_model(self) -> ForecastProvider:
         """Convert ForecastProviderCreateSchema to a ForecastProvider domain model instance."""
         configuration: Optional[ForecastProviderConfig] = None
         if self.config:
-            config_class = FORECAST_PROVIDER_CONFIG_TYPE_MAP.get(self.adapter_type, None)
-            if config_class:
-                configuration = cast(ForecastProviderConfig, config_class.from_dict(self.config))
+            configuration = build_forecast_provider_config(self.adapter_type, self.config)
 
         return ForecastProvider(
             id=EntityId(uuid.uuid4()),
             name=self.name,
             adapter_type=self.adapter_type,
             config=configuration,
-            external_service_id=EntityId(uuid.UUID(self.external_service_id)) if self.external_service_id else None,
+            external_service_id=EntityId(self.external_service_id) if self.external_service_id else None,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            uuid.UUID: str,
-            ForecastProviderAdapter: lambda v: v.value,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class ForecastProviderUpdateSchema(BaseModel):
@@ -314,36 +222,15 @@ class ForecastProviderUpdateSchema(BaseModel):
 
     name: str = Field(default="", description="Forecast provider name")
     config: Optional[dict] = Field(default=None, description="Forecast provider configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate forecast provider name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
-
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
-
-    class Config:
-        """Pydantic configuration."""
+        return v.strip()
 
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            uuid.UUID: str,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class ForecastProviderDummySolarConfigSchema(BaseModel):
@@ -398,20 +285,10 @@ class ForecastProviderDummySolarConfigSchema(BaseModel):
 
     def to_model(self) -> ForecastProviderDummySolarConfig:
         """Convert schema to ForecastProviderDummySolarConfig adapter configuration model instance."""
-        return ForecastProviderDummySolarConfig(
-            latitude=self.latitude,
-            longitude=self.longitude,
-            capacity_kwp=self.capacity_kwp,
-            efficiency_percent=self.efficiency_percent,
-            production_start_hour=self.production_start_hour,
-            production_end_hour=self.production_end_hour,
-        )
-
-    class Config:
-        """Pydantic configuration."""
+        # Schema fields mirror the configuration dataclass fields one to one
+        return ForecastProviderDummySolarConfig(**self.model_dump())
 
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class ForecastProviderHomeAssistantConfigSchema(BaseModel):
@@ -446,32 +323,10 @@ class ForecastProviderHomeAssistantConfigSchema(BaseModel):
 
     def to_model(self) -> ForecastProviderHomeAssistantConfig:
         """Convert schema to ForecastProviderHomeAssistantConfig adapter configuration model instance."""
-        return ForecastProviderHomeAssistantConfig(
-            entity_forecast_power_actual_h=self.entity_forecast_power_actual_h,
-            entity_forecast_power_next_1h=self.entity_forecast_power_next_1h,
-            entity_forecast_power_next_12h=self.entity_forecast_power_next_12h,
-            entity_forecast_power_next_24h=self.entity_forecast_power_next_24h,
-            entity_forecast_energy_actual_h=self.entity_forecast_energy_actual_h,
-            entity_forecast_energy_next_1h=self.entity_forecast_energy_next_1h,
-            entity_forecast_energy_today=self.entity_forecast_energy_today,
-            entity_forecast_energy_tomorrow=self.entity_forecast_energy_tomorrow,
-            entity_forecast_energy_remaining_today=self.entity_forecast_energy_remaining_today,
-            unit_forecast_power_actual_h=self.unit_forecast_power_actual_h,
-            unit_forecast_power_next_1h=self.unit_forecast_power_next_1h,
-            unit_forecast_power_next_12h=self.unit_forecast_power_next_12h,
-            unit_forecast_power_next_24h=self.unit_forecast_power_next_24h,
-            unit_forecast_energy_actual_h=self.unit_forecast_energy_actual_h,
-            unit_forecast_energy_next_1h=self.unit_forecast_energy_next_1h,
-            unit_forecast_energy_today=self.unit_forecast_energy_today,
-            unit_forecast_energy_tomorrow=self.unit_forecast_energy_tomorrow,
-            unit_forecast_energy_remaining_today=self.unit_forecast_energy_remaining_today,
-        )
+        # Schema fields mirror the configuration dataclass fields one to one
+        return ForecastProviderHomeAssistantConfig(**self.model_dump())
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 FORECAST_PROVIDER_CONFIG_SCHEMA_MAP: Dict[
@@ -481,3 +336,34 @@ FORECAST_PROVIDER_CONFIG_SCHEMA_MAP: Dict[
     ForecastProviderDummySolarConfig: ForecastProviderDummySolarConfigSchema,
     ForecastProviderHomeAssistantConfig: ForecastProviderHomeAssistantConfigSchema,
 }
+
+# JSON schemas are a pure function of the schema classes, so build them once at import time
+FORECAST_PROVIDER_CONFIG_JSON_SCHEMA_MAP: Dict[type[ForecastProviderConfig], Dict[str, Any]] = {
+    config_type: config_schema.model_json_schema()
+    for config_type, config_schema in FORECAST_PROVIDER_CONFIG_SCHEMA_MAP.items()
+}
+
+
+def build_forecast_provider_config(
+    adapter_type: ForecastProviderAdapter, data: Dict[str, Any]
+) -> ForecastProviderConfig:
+    """
+    Validate client configuration data against the config schema of adapter_type
+    and build the adapter configuration from it.
+
+    Raises:
+        ForecastProviderConfigurationError: If adapter_type has no configuration, or
+            data holds keys its configuration does not define.
+        ValidationError: If a value does not match the type or range of its field.
+    """
+    config_class = _CONFIG_TYPE_FOR(adapter_type)
+    if config_class is None:
+        raise ForecastProviderConfigurationError(f"No configuration class found for adapter type {adapter_type}")
+    config_schema = FORECAST_PROVIDER_CONFIG_SCHEMA_MAP[config_class]
+
+    unknown_keys = data.keys() - config_schema.model_fields.keys()
+    if unknown_keys:
+        raise ForecastProviderConfigurationError(
+            f"Unknown configuration keys for {config_class.__name__}: {', '.join(sorted(unknown_keys))}"
+        )
+    return config_schema.model_validate(data).to_model()
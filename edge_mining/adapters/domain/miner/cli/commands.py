@@ -580,6 +580,8 @@ def handle_miner_controller_pyasic_config(
     default_username: Optional[str] = None
     default_password: Optional[str] = None
     default_protocol: MinerControllerProtocol = MinerControllerProtocol.WEB
+    default_discovery_ttl: float = 60.0
+    default_metrics_ttl: float = 2.0
 
     # Try to get defaults from current_config
     if current_config and current_config.is_valid(MinerControllerAdapter.PYASIC):
@@ -589,6 +591,8 @@ def handle_miner_controller_pyasic_config(
         default_username = config.username or default_username
         default_password = config.password or default_password
         default_protocol = config.protocol or default_protocol
+        default_discovery_ttl = config.discovery_ttl
+        default_metrics_ttl = config.metrics_ttl
 
     ip: str = click.prompt(
         "IP address of the PyASIC miner (eg. 192.168.1.100)",
@@ -626,7 +630,15 @@ def handle_miner_controller_pyasic_config(
     if password == "":
         password = None
 
-    return MinerControllerPyASICConfig(ip=ip, port=port, username=username, password=password, protocol=protocol)
+    return MinerControllerPyASICConfig(
+        ip=ip,
+        port=port,
+        username=username,
+        password=password,
+        protocol=protocol,
+        discovery_ttl=default_discovery_ttl,
+        metrics_ttl=default_metrics_ttl,
+    )
 
 
 def handle_miner_controller_configuration(
@@ -3,7 +3,11 @@ pyasic adapter (Implementation of Port)
 that controls a miner via pyasic.
 """
 
-from typing import Dict, Optional, cast
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
 
 import pyasic
 from pyasic import AnyMiner
@@ -59,10 +63,94 @@ class PyASICMinerControllerAdapterFactory(MinerControllerAdapterFactory):
             port=miner_controller_configuration.port,
             username=miner_controller_configuration.username,
             password=miner_controller_configuration.password,
+            discovery_ttl=miner_controller_configuration.discovery_ttl,
+            metrics_ttl=miner_controller_configuration.metrics_ttl,
             logger=logger,
         )
 
 
+class _MinerMetrics(NamedTuple):
+    """Raw pyasic readings collected in a single refresh."""
+
+    hashrate: Optional[AlgoHashRate]
+    wattage: Optional[int]
+    mining_state: Optional[bool]
+
+
+# pyasic is_mining() result to miner status
+_STATE_MAP: Dict[Optional[bool], MinerStatus] = {
+    True: MinerStatus.ON,
+    False: MinerStatus.OFF,
+    None: MinerStatus.UNKNOWN,
+}
+
+# Default maximum age of the discovered miner instance. pyasic discovery sniffs
+# the protocols exposed by the miner and is far more expensive than a single read.
+DISCOVERY_CACHE_TTL_SECONDS = 60.0
+
+# Default maximum age of the cached metrics before a getter triggers a new refresh,
+# so that a status poll reading hashrate, power and status hits the miner only once.
+METRICS_CACHE_TTL_SECONDS = 2.0
+
+# Maximum number of discovered miners kept in the shared pool
+MINER_POOL_MAX_SIZE = 64
+
+
+class _MinerPool:
+    """
+    Process-wide LRU pool of discovered pyasic miners, shared by every controller
+    that targets the same miner with the same connection settings, so that the
+    protocol sniffing and any session state kept by pyasic are reused.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[AnyMiner, float]] = OrderedDict()
+        # Controllers may run on the background loop or on the API loop, so guard with a thread lock
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, max_age: float) -> Optional[Tuple[AnyMiner, float]]:
+        """Return the pooled miner and its discovery time, or None if missing or older than max_age."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] >= max_age:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, miner: AnyMiner, discovered_at: float) -> None:
+        """Store a discovered miner, evicting the least recently used one when full."""
+        with self._lock:
+            self._entries[key] = (miner, discovered_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a pooled miner."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every pooled miner."""
+        with self._lock:
+            self._entries.clear()
+
+
+_miner_pool = _MinerPool(MINER_POOL_MAX_SIZE)
+
+
+def clear_miner_pool() -> None:
+    """
+    Drop every discovered miner shared between pyasic controllers.
+    pyasic opens a connection per request, so there is nothing else to tear down.
+    """
+    _miner_pool.clear()
+
+
 class PyASICMinerController(MinerControlPort):
     """Controls a miner via pyasic."""
 
@@ -73,6 +161,8 @@ class PyASICMinerController(MinerControlPort):
         username: Optional[str] = None,
         password: Optional[str] = None,
         protocol: Optional[MinerControllerProtocol] = None,
+        discovery_ttl: float = DISCOVERY_CACHE_TTL_SECONDS,
+        metrics_ttl: float = METRICS_CACHE_TTL_SECONDS,
         logger: Optional[LoggerPort] = None,
     ):
         self.logger = logger
@@ -82,187 +172,313 @@ class PyASICMinerController(MinerControlPort):
         self.port = port
         self.username = username
         self.protocol = protocol
+        self.discovery_ttl = discovery_ttl
+        self.metrics_ttl = metrics_ttl
 
         self._miner: Optional[AnyMiner] = None
+        self._miner_cached_at: float = 0.0
+        # Controllers with identical connection settings share the discovered miner
+        self._pool_key: Hashable = (ip, port, protocol, username, password)
+
+        self._metrics: Optional[_MinerMetrics] = None
+        self._metrics_fetched_at: float = 0.0
 
         self._log_configuration()
 
-    def _log_configuration(self):
-        if self.logger:
-            self.logger.debug(f"Entities Configured: IP={self.ip}")
+    def _debug(self, msg: str, *args: Any) -> None:
+        """Log a debug message, formatting it only when debug logging is enabled."""
+        if self.logger and self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(msg % args if args else msg)
 
-    def _get_miner(self) -> None:
+    def _log_configuration(self):
+        self._debug("Entities Configured: IP=%s", self.ip)
+
+    def _configure_miner(self, miner: AnyMiner) -> None:
+        """Set additional parameters like protocol, password, port on the pyasic miner instance."""
+        if self.protocol == MinerControllerProtocol.RPC:
+            if isinstance(miner.rpc, BaseMinerRPCAPI):
+                if self.port:
+                    miner.rpc.port = self.port
+                if self.password:
+                    miner.rpc.pwd = self.password
+            else:
+                if self.logger:
+                    self.logger.error("Unknown PyASIC Miner Controller RPC Protocol")
+        elif self.protocol == MinerControllerProtocol.WEB:
+            if isinstance(miner.web, BaseWebAPI):
+                if self.port:
+                    miner.web.port = self.port
+                if self.password:
+                    miner.web.pwd = self.password
+                if self.username:
+                    miner.web.username = self.username
+            else:
+                if self.logger:
+                    self.logger.error("Unknown PyASIC Miner Controller Web Protocol")
+        elif self.protocol == MinerControllerProtocol.SSH:
+            if isinstance(miner.ssh, BaseSSH):
+                if self.port:
+                    miner.ssh.port = self.port
+                if self.password:
+                    miner.ssh.pwd = self.password
+                if self.username:
+                    miner.ssh.username = self.username
+            else:
+                if self.logger:
+                    self.logger.error("Unknown PyASIC Miner Controller SSH Protocol")
+        else:
+            if self.logger:
+                self.logger.error(f"Unknown PyASIC Miner Controller Protocol: {self.protocol}")
+
+    async def _discover_miner(self) -> Optional[AnyMiner]:
+        """Return the pyasic miner instance, discovering it again once discovery_ttl has elapsed."""
+        if self._miner is None or time.monotonic() - self._miner_cached_at >= self.discovery_ttl:
+            self._miner = None
+
+            pooled = _miner_pool.get(self._pool_key, self.discovery_ttl)
+            if pooled is not None:
+                self._miner, self._miner_cached_at = pooled
+                return self._miner
+
+            miner = await pyasic.get_miner(self.ip)
+            if miner is not None:
+                self._configure_miner(miner)
+                self._miner = miner
+                self._miner_cached_at = time.monotonic()
+                _miner_pool.put(self._pool_key, self._miner, self._miner_cached_at)
+
+                self._debug("Successfully retrieved miner instance from %s", self.ip)
+        return self._miner
+
+    def invalidate(self) -> None:
+        """Drop the cached miner instance and metrics, so that the next call discovers the miner again."""
+        self._miner = None
+        self._metrics = None
+        _miner_pool.discard(self._pool_key)
+
+    async def _aget_miner(self) -> Optional[AnyMiner]:
         """Retrieve the pyasic miner instance."""
-        if self._miner is None:
-            try:
-                miner = run_async_func(pyasic.get_miner(self.ip))
-                if miner is not None:
-                    self._miner = cast(AnyMiner, miner)
-
-                    # Set additional parameters like protocol, password,port
-                    if self.protocol == MinerControllerProtocol.RPC:
-                        if isinstance(self._miner.rpc, BaseMinerRPCAPI):
-                            if self.port:
-                                self._miner.rpc.port = self.port
-                            if self.password:
-                                self._miner.rpc.pwd = self.password
-                        else:
-                            if self.logger:
-                                self.logger.error("Unknown PyASIC Miner Controller RPC Protocol")
-                    elif self.protocol == MinerControllerProtocol.WEB:
-                        if isinstance(self._miner.web, BaseWebAPI):
-                            if self.port:
-                                self._miner.web.port = self.port
-                            if self.password:
-                                self._miner.web.pwd = self.password
-                            if self.username:
-                                self._miner.web.username = self.username
-                        else:
-                            if self.logger:
-                                self.logger.error("Unknown PyASIC Miner Controller Web Protocol")
-                    elif self.protocol == MinerControllerProtocol.SSH:
-                        if isinstance(self._miner.ssh, BaseSSH):
-                            if self.port:
-                                self._miner.ssh.port = self.port
-                            if self.password:
-                                self._miner.ssh.pwd = self.password
-                            if self.username:
-                                self._miner.ssh.username = self.username
-                        else:
-                            if self.logger:
-                                self.logger.error("Unknown PyASIC Miner Controller SSH Protocol")
-                    else:
-                        if self.logger:
-                            self.logger.error(f"Unknown PyASIC Miner Controller Protocol: {self.protocol}")
-
-                    if self.logger:
-                        self.logger.debug(f"Successfully retrieved miner instance from {self.ip}")
-            except Exception as e:
+        try:
+            return await self._discover_miner()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Failed to retrieve miner instance from {self.ip}: {e}")
+            return None
+
+    async def _refresh_async(self) -> Optional[_MinerMetrics]:
+        """Discover the miner if needed, then read all metrics concurrently."""
+        miner = await self._discover_miner()
+        if miner is None:
+            return None
+
+        results = await asyncio.gather(
+            miner.get_hashrate(),
+            miner.get_wattage(),
+            miner.is_mining(),
+            return_exceptions=True,
+        )
+
+        # A failing reading must not discard the others, report it as unavailable
+        # and discover the miner again on the next refresh
+        values = []
+        failed = False
+        for name, result in zip(_MinerMetrics._fields, results, strict=True):
+            if isinstance(result, BaseException):
                 if self.logger:
-                    self.logger.error(f"Failed to retrieve miner instance from {self.ip}: {e}")
+                    self.logger.warning(f"Failed to fetch {name} from {self.ip}: {result!r}")
+                failed = True
+                result = None
+            values.append(result)
 
-    def get_miner_hashrate(self) -> Optional[HashRate]:
+        if failed:
+            self.invalidate()
+
+        return _MinerMetrics(*values)
+
+    async def arefresh(self) -> None:
         """
-        Gets the current hash rate, if available.
+        Fetches hashrate, power consumption and mining state in a single
+        concurrent round trip, caching them for the individual getters.
         """
+        self._debug("Refreshing metrics from %s...", self.ip)
 
-        if self.logger:
-            self.logger.debug(f"Fetching hashrate from from {self.ip}...")
+        try:
+            metrics = await self._refresh_async()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(f"Failed to retrieve miner instance from {self.ip}: {e}")
+            self.invalidate()
+            metrics = None
 
-        # Get pyasic miner instance
-        self._get_miner()
+        self._metrics = metrics
+        self._metrics_fetched_at = time.monotonic()
 
-        if not self._miner:
-            if self.logger:
-                self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
+    def refresh(self) -> None:
+        """
+        Fetches hashrate, power consumption and mining state in a single
+        concurrent round trip, caching them for the individual getters.
+        """
+        run_async_func(self.arefresh())
+
+    def _fresh_metrics(self, ttl: Optional[float] = None) -> Optional[_MinerMetrics]:
+        """Return the cached metrics if younger than ttl (default metrics_ttl) seconds, None otherwise."""
+        if ttl is None:
+            ttl = self.metrics_ttl
+        metrics = self._metrics
+        if metrics is None or time.monotonic() - self._metrics_fetched_at >= ttl:
             return None
+        return metrics
+
+    async def _acache_or_refresh(self, ttl: Optional[float] = None) -> Optional[_MinerMetrics]:
+        """Return the cached metrics, refreshing them if missing or older than ttl (default metrics_ttl) seconds."""
+        metrics = self._fresh_metrics(ttl)
+        if metrics is not None:
+            return metrics
+
+        await self.arefresh()
+
+        if self._metrics is None and self.logger:
+            self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
+
+        return self._metrics
 
-        miner = self._miner
-        hashrate: Optional[AlgoHashRate] = run_async_func(miner.get_hashrate())
+    def _hashrate_from(self, metrics: Optional[_MinerMetrics]) -> Optional[HashRate]:
+        """Convert the hashrate of the given metrics, if available."""
+        if metrics is None:
+            return None
+
+        hashrate = metrics.hashrate
         if hashrate is None:
-            if self.logger:
-                self.logger.debug(f"Failed to fetch hashrate from {self.ip}...")
+            self._debug("Failed to fetch hashrate from %s...", self.ip)
             return None
         real_hashrate = HashRate(value=float(hashrate), unit=str(hashrate.unit))
 
-        if self.logger:
-            self.logger.debug(f"Hashrate fetched: {real_hashrate}")
+        self._debug("Hashrate fetched: %s", real_hashrate)
 
         return real_hashrate
 
-    def get_miner_power(self) -> Optional[Watts]:
-        """Gets the current power consumption, if available."""
-        if self.logger:
-            self.logger.debug(f"Fetching power consumption from from {self.ip}...")
-
-        # Get pyasic miner instance
-        self._get_miner()
-
-        if not self._miner:
-            if self.logger:
-                self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
+    def _power_from(self, metrics: Optional[_MinerMetrics]) -> Optional[Watts]:
+        """Convert the power consumption of the given metrics, if available."""
+        if metrics is None:
             return None
 
-        miner = self._miner
-        wattage = run_async_func(miner.get_wattage())
+        wattage = metrics.wattage
         if wattage is None:
-            if self.logger:
-                self.logger.debug(f"Failed to fetch power consumption from {self.ip}...")
+            self._debug("Failed to fetch power consumption from %s...", self.ip)
             return None
         power_watts = Watts(wattage)
 
-        if self.logger:
-            self.logger.debug(f"Power consumption fetched: {power_watts}")
+        self._debug("Power consumption fetched: %s", power_watts)
 
         return power_watts
 
-    def get_miner_status(self) -> MinerStatus:
-        """Gets the current operational status of the miner."""
-        if self.logger:
-            self.logger.debug(f"Fetching miner status from {self.ip}...")
+    def _status_from(self, metrics: Optional[_MinerMetrics]) -> MinerStatus:
+        """Convert the mining state of the given metrics into a MinerStatus."""
+        if metrics is None:
+            return MinerStatus.UNKNOWN
 
-        # Get pyasic miner instance
-        self._get_miner()
+        miner_status = _STATE_MAP.get(metrics.mining_state, MinerStatus.UNKNOWN)
 
-        if not self._miner:
-            if self.logger:
-                self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
-            return MinerStatus.UNKNOWN
+        self._debug("Miner status fetched: %s", miner_status)
 
-        miner = self._miner
-        mining_state = run_async_func(miner.is_mining())
+        return miner_status
 
-        state_map: Dict[Optional[bool], MinerStatus] = {
-            True: MinerStatus.ON,
-            False: MinerStatus.OFF,
-            None: MinerStatus.UNKNOWN,
-        }
+    async def aget_miner_hashrate(self) -> Optional[HashRate]:
+        """Gets the current hash rate, if available."""
+        self._debug("Fetching hashrate from %s...", self.ip)
 
-        miner_status = state_map.get(mining_state, MinerStatus.UNKNOWN)
+        return self._hashrate_from(await self._acache_or_refresh())
 
-        if self.logger:
-            self.logger.debug(f"Miner status fetched: {miner_status}")
+    async def aget_miner_power(self) -> Optional[Watts]:
+        """Gets the current power consumption, if available."""
+        self._debug("Fetching power consumption from %s...", self.ip)
 
-        return miner_status
+        return self._power_from(await self._acache_or_refresh())
 
-    def stop_miner(self) -> bool:
+    async def aget_miner_status(self) -> MinerStatus:
+        """Gets the current operational status of the miner."""
+        self._debug("Fetching miner status from %s...", self.ip)
+
+        return self._status_from(await self._acache_or_refresh())
+
+    async def astop_miner(self) -> bool:
         """Attempts to stop the specified miner. Returns True on success request."""
-        if self.logger:
-            self.logger.debug(f"Sending stop command to miner at {self.ip}...")
+        self._debug("Sending stop command to miner at %s...", self.ip)
 
         # Get pyasic miner instance
-        self._get_miner()
+        miner = await self._aget_miner()
 
-        if not self._miner:
+        if not miner:
             if self.logger:
                 self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
             return False
 
-        miner = self._miner
-        success = run_async_func(miner.stop_mining())
+        try:
+            success = await miner.stop_mining()
+        except Exception:
+            self.invalidate()
+            raise
+        finally:
+            # The cached metrics no longer reflect the miner state
+            self._metrics = None
 
-        if self.logger:
-            self.logger.debug(f"Stop command sent. Success: {success}")
+        self._debug("Stop command sent. Success: %s", success)
 
         return success or False
 
-    def start_miner(self) -> bool:
+    async def astart_miner(self) -> bool:
         """Attempts to start the miner. Returns True on success request."""
-        if self.logger:
-            self.logger.debug(f"Sending start command to miner at {self.ip}...")
+        self._debug("Sending start command to miner at %s...", self.ip)
 
         # Get pyasic miner instance
-        self._get_miner()
+        miner = await self._aget_miner()
 
-        if not self._miner:
+        if not miner:
             if self.logger:
                 self.logger.error(f"Failed to retrieve miner instance from {self.ip}...")
             return False
 
-        miner = self._miner
-        success = run_async_func(miner.resume_mining())
+        try:
+            success = await miner.resume_mining()
+        except Exception:
+            self.invalidate()
+            raise
+        finally:
+            # The cached metrics no longer reflect the miner state
+            self._metrics = None
 
-        if self.logger:
-            self.logger.debug(f"Start command sent. Success: {success}")
+        self._debug("Start command sent. Success: %s", success)
 
         return success or False
+
+    # Synchronous API, each call runs the matching coroutine on the shared background loop.
+    # Getters served from fresh cached metrics never suspend, so they skip the loop entirely.
+
+    def get_miner_hashrate(self) -> Optional[HashRate]:
+        """Gets the current hash rate, if available."""
+        metrics = self._fresh_metrics()
+        if metrics is None:
+            return run_async_func(self.aget_miner_hashrate())
+        return self._hashrate_from(metrics)
+
+    def get_miner_power(self) -> Optional[Watts]:
+        """Gets the current power consumption, if available."""
+        metrics = self._fresh_metrics()
+        if metrics is None:
+            return run_async_func(self.aget_miner_power())
+        return self._power_from(metrics)
+
+    def get_miner_status(self) -> MinerStatus:
+        """Gets the current operational status of the miner."""
+        metrics = self._fresh_metrics()
+        if metrics is None:
+            return run_async_func(self.aget_miner_status())
+        return self._status_from(metrics)
+
+    def stop_miner(self) -> bool:
+        """Attempts to stop the specified miner. Returns True on success request."""
+        return run_async_func(self.astop_miner())
+
+    def start_miner(self) -> bool:
+        """Attempts to start the miner. Returns True on success request."""
+        return run_async_func(self.astart_miner())
@@ -545,6 +545,12 @@ class MinerControllerPyASICConfigSchema(BaseModel):
     protocol: MinerControllerProtocol = Field(
         default=MinerControllerProtocol.WEB, description="Protocol to use for connecting to the miner"
     )
+    discovery_ttl: float = Field(
+        default=60.0, ge=0, description="Seconds before the miner is discovered again (0 disables caching)"
+    )
+    metrics_ttl: float = Field(
+        default=2.0, ge=0, description="Seconds the hashrate, power and status readings are reused (0 disables caching)"
+    )
 
     @field_validator("ip")
     @classmethod
@@ -606,6 +612,8 @@ class MinerControllerPyASICConfigSchema(BaseModel):
             username=self.username,
             password=self.password,
             protocol=self.protocol,
+            discovery_ttl=self.discovery_ttl,
+            metrics_ttl=self.metrics_ttl,
         )
 
     class Config:
@@ -1,12 +1,12 @@
 """API Router for notification domain"""
 
-import uuid
-from typing import Annotated, Any, Dict, List, Optional, cast
+from typing import Annotated, Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from edge_mining.adapters.domain.notification.schemas import (
-    NOTIFICATION_CONFIG_SCHEMA_MAP,
+    NOTIFICATION_CONFIG_JSON_SCHEMA_MAP,
     NotifierCreateSchema,
     NotifierSchema,
     NotifierUpdateSchema,
@@ -29,9 +29,19 @@ from edge_mining.domain.notification.exceptions import (
     NotifierConfigurationError,
     NotifierNotFoundError,
 )
-from edge_mining.shared.interfaces.config import Configuration, NotificationConfig
+from edge_mining.shared.adapter_maps.notification import NOTIFIER_CONFIG_TYPE_MAP
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Adapter type -> JSON schema of its configuration, resolved once through
+# the configuration class so the config-schema route needs a single lookup
+_CONFIG_JSON_SCHEMA_BY_ADAPTER: Dict[NotificationAdapter, Dict[str, Any]] = {
+    adapter: NOTIFICATION_CONFIG_JSON_SCHEMA_MAP[config_type]
+    for adapter, config_type in NOTIFIER_CONFIG_TYPE_MAP.items()
+    if config_type is not None and config_type in NOTIFICATION_CONFIG_JSON_SCHEMA_MAP
+}
+
+_NOTIFIER_TYPES: Tuple[NotificationAdapter, ...] = tuple(NotificationAdapter)
 
 
 @router.get("/notifiers", response_model=List[NotifierSchema])
@@ -43,12 +53,7 @@ async def get_notifiers_list(
         notifiers = config_service.list_notifiers()
 
         # Convert to notifier schema
-        notifier_schemas: List[NotifierSchema] = []
-
-        for notifier in notifiers:
-            notifier_schemas.append(NotifierSchema.from_model(notifier))
-
-        return notifier_schemas
+        return [NotifierSchema.from_model(notifier) for notifier in notifiers]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -56,10 +61,8 @@ async def get_notifiers_list(
 @router.get("/notifiers/types", response_model=List[NotificationAdapter])
 async def get_notifier_types() -> List[NotificationAdapter]:
     """Get a list of available notifier types."""
-    try:
-        return [NotificationAdapter(adapter.value) for adapter in NotificationAdapter]
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    # Hand out a copy so the cached tuple can never be mutated by a caller
+    return list(_NOTIFIER_TYPES)
 
 
 @router.get(
@@ -68,30 +71,15 @@ async def get_notifier_types() -> List[NotificationAdapter]:
 )
 async def get_notifier_config_schema(
     adapter_type: NotificationAdapter,
-    config_service: Annotated[ConfigurationServiceInterface, Depends(get_config_service)],
 ) -> Dict[str, Any]:
     """Get the configuration schema for a specific notifier type."""
     try:
-        try:
-            notification_adapter = NotificationAdapter(adapter_type)
-        except ValueError as e:
-            raise ValueError(f"Invalid notification adapter type: {adapter_type}") from e
-
-        # Get the corresponding configuration class for the adapter type
-        notifier_config_type: Optional[type[NotificationConfig]] = config_service.get_notifier_config_by_type(
-            notification_adapter
-        )
-
-        if notifier_config_type is None:
-            raise NotifierConfigurationError(f"No configuration class found for adapter type {adapter_type}")
+        notifier_config_json_schema = _CONFIG_JSON_SCHEMA_BY_ADAPTER.get(adapter_type, None)
 
-        # Map the configuration class to its corresponding schema
-        notifier_config_schema = NOTIFICATION_CONFIG_SCHEMA_MAP.get(notifier_config_type, None)
+        if notifier_config_json_schema is None:
+            raise NotifierConfigurationError(f"No configuration schema found for adapter type {adapter_type}")
 
-        if notifier_config_schema is None:
-            raise NotifierConfigurationError(f"No schema found for configuration class {notifier_config_type}")
-
-        return notifier_config_schema.model_json_schema()
+        return notifier_config_json_schema
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
@@ -157,28 +145,16 @@ async def update_notifier(
 ) -> NotifierSchema:
     """Update a notifier's details."""
     try:
-        notifier = config_service.get_notifier(notifier_id)
-
-        if notifier is None:
-            raise NotifierNotFoundError(f"Notifier with ID {notifier_id} not found")
-
-        configuration: Optional[Configuration] = None
-        if notifier_update.config:
-            config_cls = config_service.get_notifier_config_by_type(notifier.adapter_type)
-            if config_cls is None:
-                raise NotifierConfigurationError(
-                    f"No configuration class found for adapter type {notifier.adapter_type}"
-                )
-            configuration = config_cls.from_dict(notifier_update.config)
-
         external_service_id: Optional[EntityId] = None
         if notifier_update.external_service_id:
-            external_service_id = EntityId(uuid.UUID(notifier_update.external_service_id))
+            external_service_id = EntityId(notifier_update.external_service_id)
 
-        updated_notifier = config_service.update_notifier(
-            notifier_id=notifier.id,
+        # The service resolves the configuration class from the stored notifier,
+        # so the notifier is read only once
+        updated_notifier = config_service.update_notifier_from_dict(
+            notifier_id=notifier_id,
             name=notifier_update.name or "",
-            config=cast(NotificationConfig, configuration),
+            config_data=notifier_update.config,
             external_service_id=external_service_id,
         )
 
@@ -2,9 +2,9 @@
 
 import json
 import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from edge_mining.adapters.infrastructure.persistence.sqlite import BaseSqliteRepository
+from edge_mining.adapters.infrastructure.persistence.sqlite import SQLITE_MAX_VARIABLES, BaseSqliteRepository
 from edge_mining.domain.common import EntityId
 from edge_mining.domain.exceptions import ConfigurationError
 from edge_mining.domain.notification.common import NotificationAdapter
@@ -37,6 +37,10 @@ class InMemoryNotifierRepository(NotifierRepository):
                 return notifier
         return None
 
+    def get_by_ids(self, notifier_ids: List[EntityId]) -> Dict[EntityId, Notifier]:
+        wanted = set(notifier_ids)
+        return {n.id: n for n in self._notifiers if n.id in wanted}
+
     def get_all(self) -> List[Notifier]:
         return self._notifiers
 
@@ -187,6 +191,32 @@ class SqliteNotifierRepository(NotifierRepository):
             if conn:
                 conn.close()
 
+    def get_by_ids(self, notifier_ids: List[EntityId]) -> Dict[EntityId, Notifier]:
+        """Retrieve the notifiers with the given IDs with one query per batch of IDs."""
+        self.logger.debug(f"Retrieving {len(notifier_ids)} notifiers from SQLite repository.")
+        # IDs are stored as text, so rows are matched back to the requested IDs by their string form
+        requested_ids = {str(notifier_id): notifier_id for notifier_id in notifier_ids}
+        keys = list(requested_ids)
+        notifiers: Dict[EntityId, Notifier] = {}
+        conn = self._db.get_connection()
+        try:
+            cursor = conn.cursor()
+            for start in range(0, len(keys), SQLITE_MAX_VARIABLES):
+                batch = keys[start : start + SQLITE_MAX_VARIABLES]
+                sql = f"SELECT * FROM notifiers WHERE id IN ({', '.join('?' * len(batch))});"
+                cursor.execute(sql, batch)
+                for row in cursor.fetchall():
+                    notifier = self._row_to_notifier(row)
+                    if notifier:
+                        notifiers[requested_ids[str(notifier.id)]] = notifier
+            return notifiers
+        except sqlite3.Error as e:
+            self.logger.error(f"SQLite error retrieving notifiers {notifier_ids}: {e}")
+            raise NotifierNotFoundError(f"DB error retrieving notifiers: {e}") from e
+        finally:
+            if conn:
+                conn.close()
+
     def get_all(self) -> List[Notifier]:
         """Retrieve all notifiers from the repository."""
         self.logger.debug("Retrieving all notifiers from SQLite repository.")
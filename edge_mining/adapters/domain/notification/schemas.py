@@ -1,9 +1,9 @@
 """Validation schemas for notification domain."""
 
 import uuid
-from typing import Dict, Optional, Union, cast
+from typing import Any, Dict, Optional, Union, cast
 
-from pydantic import BaseModel, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from edge_mining.domain.common import EntityId
 from edge_mining.domain.notification.common import NotificationAdapter
@@ -15,104 +15,68 @@ from edge_mining.shared.adapter_configs.notification import (
 from edge_mining.shared.adapter_maps.notification import NOTIFIER_CONFIG_TYPE_MAP
 from edge_mining.shared.interfaces.config import NotificationConfig
 
+# Bound once so the hot to_model paths skip the global and attribute lookups
+_CONFIG_TYPE_FOR = NOTIFIER_CONFIG_TYPE_MAP.get
+
+# Adapter values are static, so build the value -> member lookup and error message once
+_ADAPTER_BY_VALUE: Dict[str, NotificationAdapter] = {adapter.value: adapter for adapter in NotificationAdapter}
+_ADAPTER_TYPE_ERROR = f"adapter_type must be one of {[adapter.value for adapter in NotificationAdapter]}"
+
 
 class NotifierSchema(BaseModel):
     """Schema for Notifier entity with complete validation."""
 
-    id: str = Field(..., description="Unique identifier for the notifier")
+    id: uuid.UUID = Field(..., description="Unique identifier for the notifier")
     name: str = Field(default="", description="Notifier name")
     adapter_type: NotificationAdapter = Field(
         default=NotificationAdapter.DUMMY, description="Type of notification adapter"
     )
-    config: dict = Field(default={}, description="Notifier configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
-
-    @field_validator("id")
-    @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Validate that id is a valid UUID string."""
-        try:
-            uuid.UUID(v)
-        except ValueError as exc:
-            raise ValueError("id must be a valid UUID string") from exc
-        return v
+    config: dict = Field(default_factory=dict, description="Notifier configuration")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate notifier name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
+        return v.strip()
 
     @field_validator("adapter_type")
     @classmethod
     def validate_adapter_type(cls, v: str) -> NotificationAdapter:
         """Validate that adapter_type is a recognized NotificationAdapter."""
-        adapter_values = [adapter.value for adapter in NotificationAdapter]
-        if v not in adapter_values:
-            raise ValueError(f"adapter_type must be one of {adapter_values}")
-        return NotificationAdapter(v)
-
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
+        adapter = _ADAPTER_BY_VALUE.get(v)
+        if adapter is None:
+            raise ValueError(_ADAPTER_TYPE_ERROR)
+        return adapter
 
     @classmethod
     def from_model(cls, notifier: Notifier) -> "NotifierSchema":
         """Create NotifierSchema from a Notifier domain model instance."""
         return cls(
-            id=str(notifier.id),
+            id=notifier.id,
             name=notifier.name,
             adapter_type=notifier.adapter_type,
             config=notifier.config.to_dict() if notifier.config else {},
-            external_service_id=str(notifier.external_service_id) if notifier.external_service_id else None,
+            external_service_id=notifier.external_service_id,
         )
 
-    @field_serializer("id")
-    def serialize_id(self, value: str) -> str:
-        """Serialize id field."""
-        return str(value)
-
-    @field_serializer("external_service_id")
-    def serialize_external_service_id(self, value: Optional[str]) -> Optional[str]:
-        """Serialize external_service_id field."""
-        return str(value) if value is not None else None
-
     def to_model(self) -> Notifier:
         """Convert NotifierSchema to Notifier domain model instance."""
         configuration: Optional[NotificationConfig] = None
         if self.config:
-            config_class = NOTIFIER_CONFIG_TYPE_MAP.get(self.adapter_type, None)
+            config_class = _CONFIG_TYPE_FOR(self.adapter_type)
             if config_class:
                 configuration = cast(NotificationConfig, config_class.from_dict(self.config))
 
         return Notifier(
-            id=EntityId(uuid.UUID(self.id)),
+            id=EntityId(self.id),
             name=self.name,
             adapter_type=self.adapter_type,
             config=configuration,
-            external_service_id=EntityId(uuid.UUID(self.external_service_id)) if self.external_service_id else None,
+            external_service_id=EntityId(self.external_service_id) if self.external_service_id else None,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        arbitrary_types_allowed = True
-        json_encoders = {
-            uuid.UUID: str,
-            NotificationAdapter: lambda v: v.value,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True, arbitrary_types_allowed=True)
 
 
 class NotifierCreateSchema(BaseModel):
@@ -123,42 +87,28 @@ class NotifierCreateSchema(BaseModel):
         default=NotificationAdapter.DUMMY, description="Type of notification adapter"
     )
     config: Optional[dict] = Field(default=None, description="Notifier configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate notifier name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
+        return v.strip()
 
     @field_validator("adapter_type")
     @classmethod
     def validate_adapter_type(cls, v: str) -> NotificationAdapter:
         """Validate that adapter_type is a recognized NotificationAdapter."""
-        adapter_values = [adapter.value for adapter in NotificationAdapter]
-        if v not in adapter_values:
-            raise ValueError(f"adapter_type must be one of {adapter_values}")
-        return NotificationAdapter(v)
-
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
+        adapter = _ADAPTER_BY_VALUE.get(v)
+        if adapter is None:
+            raise ValueError(_ADAPTER_TYPE_ERROR)
+        return adapter
 
     def to_model(self) -> Notifier:
         """Convert NotifierCreateSchema to a Notifier domain model instance."""
         configuration: Optional[NotificationConfig] = None
         if self.config:
-            config_class = NOTIFIER_CONFIG_TYPE_MAP.get(self.adapter_type, None)
+            config_class = _CONFIG_TYPE_FOR(self.adapter_type)
             if config_class:
                 configuration = cast(NotificationConfig, config_class.from_dict(self.config))
 
@@ -167,18 +117,10 @@ class NotifierCreateSchema(BaseModel):
             name=self.name,
             adapter_type=self.adapter_type,
             config=configuration,
-            external_service_id=EntityId(uuid.UUID(self.external_service_id)) if self.external_service_id else None,
+            external_service_id=EntityId(self.external_service_id) if self.external_service_id else None,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            uuid.UUID: str,
-            NotificationAdapter: lambda v: v.value,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class NotifierUpdateSchema(BaseModel):
@@ -186,36 +128,15 @@ class NotifierUpdateSchema(BaseModel):
 
     name: str = Field(default="", description="Notifier name")
     config: Optional[dict] = Field(default=None, description="Notifier configuration")
-    external_service_id: Optional[str] = Field(default=None, description="ID of external service")
+    external_service_id: Optional[uuid.UUID] = Field(default=None, description="ID of external service")
 
     @field_validator("name")
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Validate notifier name."""
-        v = v.strip()
-        if not v:
-            v = ""
-        return v
+        return v.strip()
 
-    @field_validator("external_service_id")
-    @classmethod
-    def validate_external_service_id(cls, v: Optional[str]) -> Optional[str]:
-        """Validate that external_service_id is a valid UUID string if provided."""
-        if v is not None:
-            try:
-                uuid.UUID(v)
-            except ValueError as exc:
-                raise ValueError("external_service_id must be a valid UUID string") from exc
-        return v
-
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
-        json_encoders = {
-            uuid.UUID: str,
-        }
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class DummyNotificationConfigSchema(BaseModel):
@@ -240,11 +161,7 @@ class DummyNotificationConfigSchema(BaseModel):
             message=self.message,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 class TelegramNotificationConfigSchema(BaseModel):
@@ -285,11 +202,7 @@ class TelegramNotificationConfigSchema(BaseModel):
             chat_id=self.chat_id,
         )
 
-    class Config:
-        """Pydantic configuration."""
-
-        use_enum_values = True
-        validate_assignment = True
+    model_config = ConfigDict(use_enum_values=True, validate_assignment=True)
 
 
 NOTIFICATION_CONFIG_SCHEMA_MAP: Dict[
@@ -299,3 +212,9 @@ NOTIFICATION_CONFIG_SCHEMA_MAP: Dict[
     DummyNotificationConfig: DummyNotificationConfigSchema,
     TelegramNotificationConfig: TelegramNotificationConfigSchema,
 }
+
+# JSON schemas are a pure function of the schema classes, so build them once at import time
+NOTIFICATION_CONFIG_JSON_SCHEMA_MAP: Dict[type[NotificationConfig], Dict[str, Any]] = {
+    config_type: config_schema.model_json_schema()
+    for config_type, config_schema in NOTIFICATION_CONFIG_SCHEMA_MAP.items()
+}
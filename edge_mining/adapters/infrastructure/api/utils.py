@@ -0,0 +1,46 @@
+"""Utility functions for FastAPI routers."""
+
+import functools
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from fastapi import HTTPException
+
+T = TypeVar("T")
+
+
+def map_exceptions(
+    mapping: Dict[type[Exception], int],
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator that turns exceptions raised by an async route handler into HTTPExceptions.
+
+    Exceptions are matched against the mapping keys in order, so subclasses must be
+    listed before their base classes. HTTPExceptions raised by the handler pass through
+    untouched, and any other exception becomes a 500 response.
+
+    Args:
+        mapping: Exception type to HTTP status code.
+
+    Example:
+        @router.get("/items/{item_id}")
+        @map_exceptions({ItemNotFoundError: 404, ValueError: 400})
+        async def get_item(item_id: EntityId) -> ItemSchema: ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        # functools.wraps keeps the signature visible to FastAPI's dependency injection
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                for exception_type, status_code in mapping.items():
+                    if isinstance(e, exception_type):
+                        raise HTTPException(status_code=status_code, detail=str(e)) from e
+                raise HTTPException(status_code=500, detail=str(e)) from e
+
+        return wrapper
+
+    return decorator
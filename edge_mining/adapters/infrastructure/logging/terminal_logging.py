@@ -43,6 +43,10 @@ class TerminalLogger(LoggerPort):
 
         # self.logger = logging.getLogger(self.name)
 
+    def is_enabled_for(self, level="DEBUG") -> bool:
+        """Check whether messages of the given level would be emitted."""
+        return logger.level(level.upper()).no >= logger.level(self.log_level.upper()).no
+
     def __call__(self, msg, level="DEBUG"):
         """Alias of self.log()"""
         self.log(msg, level)
@@ -12,6 +12,10 @@ from edge_mining.shared.logging.port import LoggerPort
 sqlite3.register_adapter(uuid.UUID, lambda u: str(u))
 # sqlite3.register_converter("UUID", lambda u: uuid.UUID(u.decode("utf-8")))
 
+# Maximum number of "?" parameters in a single statement on older SQLite builds,
+# used to split "IN (...)" lookups into batches
+SQLITE_MAX_VARIABLES = 999
+
 
 class BaseSqliteRepository:
     """Base class for SQLite repositories."""
@@ -4,6 +4,7 @@ import uuid
 from typing import Annotated, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 
 from edge_mining.adapters.infrastructure.api.setup import get_optimization_service
 from edge_mining.adapters.infrastructure.rule_engine.common import OPERATOR_SYMBOLS, OperatorType, RuleEngineType
@@ -76,8 +77,11 @@ async def evaluate_rules(
         for rule_schema in evaluation_request.rules:
             automation_rules.append(rule_schema.to_model())
 
-        context: Optional[DecisionalContext] = optimization_service.get_decisional_context(
-            EntityId(uuid.UUID(evaluation_request.optimization_unit))
+        # Building the context reads the miners through their blocking controllers,
+        # so it runs in the threadpool instead of on the event loop
+        context: Optional[DecisionalContext] = await run_in_threadpool(
+            optimization_service.get_decisional_context,
+            EntityId(uuid.UUID(evaluation_request.optimization_unit)),
         )
 
         if not context:
@@ -1,35 +1,186 @@
 """Collection of utility functions for adapters."""
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Coroutine, TypeVar
+import atexit
+import contextvars
+import os
+import queue
+import threading
+import warnings
+from typing import Any, Awaitable, Callable, Coroutine, Optional, TypeVar
+
+try:
+    # uvloop comes with uvicorn[standard] and is faster than the stdlib selector loop
+    import uvloop
+
+    _new_event_loop: Callable[[], asyncio.AbstractEventLoop] = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
 
 T = TypeVar("T")
 
+# When set to "1", run_async_func raises instead of warning when it is called from a
+# thread that is running an event loop, e.g. to catch such calls in tests.
+STRICT_ASYNC_ENV_VAR = "EDGE_MINING_STRICT_ASYNC"
+
+# Shared event loop, running forever in a daemon thread, that hosts every coroutine
+# submitted through run_async_func. It is started lazily on first use, and is a uvloop
+# loop when uvloop is installed.
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_thread: Optional[threading.Thread] = None
+_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use."""
+    global _loop, _loop_thread
+
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = _new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="run_async_func_loop", daemon=True)
+                thread.start()
+                atexit.register(_stop_background_loop)
+                _loop_thread = thread
+                _loop = loop
+    return _loop
+
+
+def _stop_background_loop() -> None:
+    """Stop the shared background event loop at interpreter exit."""
+    if _loop is not None:
+        _loop.call_soon_threadsafe(_loop.stop)
+    if _loop_thread is not None:
+        _loop_thread.join(timeout=1)
+
+
+async def _await(func: Awaitable[T]) -> T:
+    """Wrap a plain awaitable in a coroutine, so that it can be run as a task."""
+    return await func
+
+
+class _ResultSlot:
+    """One-shot hand-off of a background task outcome to the thread waiting for it."""
+
+    __slots__ = ("done", "result", "exception")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+    def set_from_task(self, task: "asyncio.Task[Any]") -> None:
+        """Store the outcome of a finished task and wake up the waiting thread."""
+        if task.cancelled():
+            self.exception = asyncio.CancelledError()
+        else:
+            self.exception = task.exception()
+            if self.exception is None:
+                self.result = task.result()
+        self.done.set()
+
+    def reset(self) -> None:
+        """Clear the slot so it can be reused for another call."""
+        self.done.clear()
+        self.result = None
+        self.exception = None
+
 
-def run_async_func(func: Coroutine[Any, Any, T]) -> T:
+# Free list of result slots, so that each call reuses one instead of allocating an Event.
+# It never holds more slots than the peak number of concurrent callers.
+_slot_pool: "queue.SimpleQueue[_ResultSlot]" = queue.SimpleQueue()
+
+
+def _acquire_slot() -> _ResultSlot:
+    """Take a result slot from the free list, or create one if it is empty."""
+    try:
+        return _slot_pool.get_nowait()
+    except queue.Empty:
+        return _ResultSlot()
+
+
+def _start_task(
+    loop: asyncio.AbstractEventLoop,
+    func: Coroutine[Any, Any, Any],
+    slot: _ResultSlot,
+    context: contextvars.Context,
+) -> None:
+    """Start func as a task on the background loop, reporting its outcome to slot."""
+    task = loop.create_task(func, context=context)
+    task.add_done_callback(slot.set_from_task)
+
+
+def run_async_func(func: Awaitable[T]) -> T:
     """
     Executes an asynchronous function (coroutine) from a synchronous context,
     handling the presence of an already running event loop.
 
-    If no event loop is running, the coroutine is executed directly using asyncio.run().
-    If an event loop is already running (e.g., in environments like FastAPI),
-    the coroutine is executed in a separate thread to avoid conflicts with the main event loop.
+    Meant for synchronous callers only: code that is already running in a coroutine
+    should await the coroutine directly instead of blocking its
+    own event loop here.
+
+    The coroutine is scheduled on a single, persistent event loop that runs in a
+    background thread, and the calling thread blocks until it completes. Reusing
+    the same loop avoids creating a thread and a new event loop on every call,
+    and works the same whether or not the caller already runs an event loop
+    (e.g., in environments like FastAPI).
+
+    The coroutine runs in a copy of the caller's context, so context variables set
+    by the caller are visible to it. The copy is taken once and shared by the
+    scheduling callback and the task, instead of being copied by each of them.
 
     Args:
-        func: A coroutine function (e.g., my_async_func()).
+        func: A coroutine object, as returned by calling a coroutine function
+            (e.g., my_async_func()), or any other awaitable.
 
     Returns:
         The result returned by the coroutine.
 
+    Calling it from a thread that runs its own event loop blocks that loop until the
+    coroutine completes, so a RuntimeWarning is emitted (or a RuntimeError raised when
+    the EDGE_MINING_STRICT_ASYNC environment variable is set to "1").
+
     Raises:
+        RuntimeError: If called from a coroutine running on the background loop itself,
+            which would otherwise deadlock, or from any running event loop in strict mode.
         Propagates any exceptions raised by the coroutine.
     """
+    loop = _get_background_loop()
 
-    try:
-        asyncio.get_running_loop()  # Triggers RuntimeError if no running event loop
-        with ThreadPoolExecutor(1) as pool:
-            return pool.submit(lambda: asyncio.run(func)).result()
+    coro = func if asyncio.iscoroutine(func) else _await(func)
+
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("run_async_func cannot be called from its own background event loop")
 
+    try:
+        asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(func)
+        # No running loop in this thread, the expected case for a synchronous caller
+        pass
+    else:
+        # Still works, but blocks the caller's event loop (e.g. FastAPI) until the coroutine completes
+        message = (
+            "run_async_func called from a thread running an event loop, which blocks it. Await the coroutine instead."
+        )
+        if os.environ.get(STRICT_ASYNC_ENV_VAR) == "1":
+            coro.close()
+            raise RuntimeError(message)
+        warnings.warn(message, RuntimeWarning, stacklevel=2)
+
+    # The caller only needs to block until the outcome is in, so a bare Event and
+    # result slot are used instead of a concurrent.futures.Future and its state machine
+    context = contextvars.copy_context()
+    slot = _acquire_slot()
+    loop.call_soon_threadsafe(_start_task, loop, coro, slot, context, context=context)
+    slot.done.wait()
+
+    # The task is done with the slot once it is set, so it can go back to the free list
+    result, exception = slot.result, slot.exception
+    slot.reset()
+    _slot_pool.put(slot)
+
+    if exception is not None:
+        raise exception
+    return result
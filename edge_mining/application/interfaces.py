@@ -43,6 +43,9 @@ from edge_mining.shared.interfaces.config import (
 class AdapterServiceInterface(ABC):
     """Base interface for all adapter services in the Edge Mining application."""
 
+    # Empty, so that implementations declaring __slots__ get no per-instance __dict__
+    __slots__ = ()
+
     @abstractmethod
     def get_energy_monitor(self, energy_source: EnergySource) -> Optional[EnergyMonitorPort]:
         """Get an energy monitor adapter instance."""
@@ -97,6 +100,18 @@ class AdapterServiceInterface(ABC):
     def clear_all_services(self):
         """Clear external services cache"""
 
+    @abstractmethod
+    def invalidate(self, entity_id: EntityId) -> None:
+        """Drop the cached adapter instance of an entity."""
+
+    @abstractmethod
+    def invalidate_external_service(self, external_service_id: EntityId) -> None:
+        """Drop the cached instance of an external service."""
+
+    @abstractmethod
+    def invalidate_cascade(self, external_service_id: EntityId) -> None:
+        """Drop the cached instance of an external service and the adapters linked to it."""
+
 
 class OptimizationServiceInterface(ABC):
     """Base interface for optimization services in the Edge Mining application."""
@@ -277,6 +292,16 @@ class ConfigurationServiceInterface(ABC):
     ) -> Notifier:
         """Update a notifier in the system."""
 
+    @abstractmethod
+    def update_notifier_from_dict(
+        self,
+        notifier_id: EntityId,
+        name: str,
+        config_data: Optional[dict],
+        external_service_id: Optional[EntityId] = None,
+    ) -> Notifier:
+        """Update a notifier in the system, building its configuration from a dictionary."""
+
     @abstractmethod
     def check_notifier(self, notifier: Notifier) -> bool:
         """Check if a notifier is valid and can be used."""
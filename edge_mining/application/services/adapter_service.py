@@ -2,7 +2,9 @@
 This service is responsible for creating and managing adapters for the application.
 """
 
-from typing import Dict, List, Optional, Union
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from edge_mining.adapters.domain.energy.monitors.dummy_solar import DummySolarEnergyMonitorFactory
 from edge_mining.adapters.domain.energy.monitors.home_assistant_api import HomeAssistantAPIEnergyMonitorFactory
@@ -41,6 +43,7 @@ from edge_mining.domain.performance.common import MiningPerformanceTrackerAdapte
 from edge_mining.domain.performance.entities import MiningPerformanceTracker
 from edge_mining.domain.performance.ports import MiningPerformanceTrackerPort, MiningPerformanceTrackerRepository
 from edge_mining.domain.policy.services import RuleEngine
+from edge_mining.shared.cache import BoundedCache
 from edge_mining.shared.external_services.common import ExternalServiceAdapter
 from edge_mining.shared.external_services.entities import ExternalService
 from edge_mining.shared.external_services.ports import ExternalServicePort, ExternalServiceRepository
@@ -49,15 +52,145 @@ from edge_mining.shared.interfaces.factories import (
     ExternalServiceFactory,
     ForecastAdapterFactory,
     MinerControllerAdapterFactory,
+    NotificationAdapterFactory,
 )
 from edge_mining.shared.logging.port import LoggerPort
 
+# Marks a cache miss, so that a single dict lookup tells it apart from a cached value
+_MISSING = object()
+
+# Maximum number of instances kept in each adapter cache and in the external service cache
+ADAPTER_CACHE_MAX_SIZE = 128
+
+# Builders turn an entity, the logger and its external service into an adapter instance
+_MinerControllerBuilder = Callable[
+    [Miner, MinerController, Optional[LoggerPort], Optional[ExternalServicePort]], MinerControlPort
+]
+_NotifierBuilder = Callable[[Notifier, Optional[LoggerPort], Optional[ExternalServicePort]], NotificationPort]
+_HomeForecastProviderBuilder = Callable[[HomeForecastProvider, Optional[LoggerPort]], HomeForecastProviderPort]
+_MiningPerformanceTrackerBuilder = Callable[
+    [MiningPerformanceTracker, Optional[LoggerPort], Optional[ExternalServicePort]], MiningPerformanceTrackerPort
+]
+
+
+def _build_dummy_miner_controller(
+    miner: Miner,
+    miner_controller: MinerController,
+    logger: Optional[LoggerPort],
+    external_service: Optional[ExternalServicePort],
+) -> MinerControlPort:
+    """Build a dummy miner controller, sized after the miner it controls."""
+    if miner.power_consumption_max is None or miner.hash_rate_max is None:
+        raise ValueError("Miner power consumption max and hash rate max are required for DummyMinerController.")
+
+    return DummyMinerController(
+        power_max=miner.power_consumption_max,
+        hashrate_max=miner.hash_rate_max,
+        logger=logger,
+    )
+
+
+def _miner_controller_factory_builder(factory_class: Type[MinerControllerAdapterFactory]) -> _MinerControllerBuilder:
+    """Wrap a miner controller factory into a builder. The factory keeps a reference miner, so one is made per build."""
+
+    def build(
+        miner: Miner,
+        miner_controller: MinerController,
+        logger: Optional[LoggerPort],
+        external_service: Optional[ExternalServicePort],
+    ) -> MinerControlPort:
+        miner_controller_factory = factory_class()
+        miner_controller_factory.from_miner(miner)
+        return miner_controller_factory.create(
+            config=miner_controller.config,
+            logger=logger,
+            external_service=external_service,
+        )
+
+    return build
+
+
+def _notifier_factory_builder(factory: NotificationAdapterFactory) -> _NotifierBuilder:
+    """Wrap a stateless notifier factory into a builder, sharing the factory instance."""
+
+    def build(
+        notifier: Notifier,
+        logger: Optional[LoggerPort],
+        external_service: Optional[ExternalServicePort],
+    ) -> NotificationPort:
+        return factory.create(config=notifier.config, logger=logger, external_service=external_service)
+
+    return build
+
 
 class AdapterService(AdapterServiceInterface):
     """
     This service is responsible for creating and managing adapters for the application.
     """
 
+    __slots__ = (
+        "energy_monitor_repo",
+        "miner_controller_repo",
+        "notifier_repo",
+        "forecast_provider_repo",
+        "mining_performance_tracker_repo",
+        "home_forecast_provider_repo",
+        "external_service_repo",
+        "_energy_monitor_cache",
+        "_miner_controller_cache",
+        "_notifier_cache",
+        "_forecast_provider_cache",
+        "_home_forecast_provider_cache",
+        "_mining_performance_tracker_cache",
+        "_service_cache",
+        "logger",
+    )
+
+    # Factories by adapter type, so that each initialization resolves its factory with a single lookup.
+    # Stateless factories are shared instances; the ones that keep a reference entity
+    # (from_energy_source / from_miner) are instantiated per adapter.
+    _EXTERNAL_SERVICE_FACTORIES: Dict[ExternalServiceAdapter, ExternalServiceFactory] = {
+        ExternalServiceAdapter.HOME_ASSISTANT_API: ServiceHomeAssistantAPIFactory(),
+    }
+    _ENERGY_MONITOR_FACTORIES: Dict[EnergyMonitorAdapter, Type[EnergyMonitorAdapterFactory]] = {
+        EnergyMonitorAdapter.DUMMY_SOLAR: DummySolarEnergyMonitorFactory,
+        EnergyMonitorAdapter.HOME_ASSISTANT_API: HomeAssistantAPIEnergyMonitorFactory,
+    }
+    _FORECAST_PROVIDER_FACTORIES: Dict[ForecastProviderAdapter, Type[ForecastAdapterFactory]] = {
+        ForecastProviderAdapter.DUMMY_SOLAR: DummyForecastProviderFactory,
+        ForecastProviderAdapter.HOME_ASSISTANT_API: HomeAssistantForecastProviderFactory,
+    }
+
+    # The factory is stateless and shared. The engines it creates are not: load_rules() stores
+    # the rules on the instance, so each caller still gets an engine of its own.
+    _RULE_ENGINE_FACTORY = RuleEngineFactory()
+
+    # Builders by adapter type, for the kinds whose adapters are not all created through a factory
+    _MINER_CONTROLLER_BUILDERS: Dict[MinerControllerAdapter, _MinerControllerBuilder] = {
+        MinerControllerAdapter.DUMMY: _build_dummy_miner_controller,
+        MinerControllerAdapter.GENERIC_SOCKET_HOME_ASSISTANT_API: _miner_controller_factory_builder(
+            GenericSocketHomeAssistantAPIMinerControllerAdapterFactory
+        ),
+        MinerControllerAdapter.PYASIC: _miner_controller_factory_builder(PyASICMinerControllerAdapterFactory),
+    }
+    _NOTIFIER_BUILDERS: Dict[NotificationAdapter, _NotifierBuilder] = {
+        NotificationAdapter.DUMMY: lambda notifier, logger, external_service: DummyNotifier(),
+        NotificationAdapter.TELEGRAM: _notifier_factory_builder(TelegramNotifierFactory()),
+    }
+    _HOME_FORECAST_PROVIDER_BUILDERS: Dict[HomeForecastProviderAdapter, _HomeForecastProviderBuilder] = {
+        # TODO - Add configuration parameters for DummyHomeForecastProvider
+        # For now, we use a default load power max of 800W.
+        HomeForecastProviderAdapter.DUMMY: lambda home_forecast_provider, logger: DummyHomeForecastProvider(
+            load_power_max=800
+        ),
+    }
+    _MINING_PERFORMANCE_TRACKER_BUILDERS: Dict[MiningPerformanceTrackerAdapter, _MiningPerformanceTrackerBuilder] = {
+        # No configuration is needed for the dummy tracker
+        MiningPerformanceTrackerAdapter.DUMMY: lambda tracker, logger, external_service: (
+            DummyMiningPerformanceTracker()
+        ),
+    }
+
     def __init__(
         self,
         energy_monitor_repo: EnergyMonitorRepository,
@@ -68,6 +201,7 @@ class AdapterService(AdapterServiceInterface):
         home_forecast_provider_repo: HomeForecastProviderRepository,
         external_service_repo: ExternalServiceRepository,
         logger: Optional[LoggerPort] = None,
+        cache_max_size: int = ADAPTER_CACHE_MAX_SIZE,
     ):
         self.energy_monitor_repo = energy_monitor_repo
         self.miner_controller_repo = miner_controller_repo
@@ -76,96 +210,88 @@ class AdapterService(AdapterServiceInterface):
         self.mining_performance_tracker_repo = mining_performance_tracker_repo
         self.home_forecast_provider_repo = home_forecast_provider_repo
         self.external_service_repo = external_service_repo
-        # Cache for already created instances
-        self._instance_cache: Dict[
-            EntityId,
-            Optional[
-                Union[
-                    EnergyMonitorPort,
-                    MinerControlPort,
-                    NotificationPort,
-                    ForecastProviderPort,
-                    HomeForecastProviderPort,
-                    MiningPerformanceTrackerPort,
-                ]
-            ],
-        ] = {}
+        # Caches for already created instances, one per kind of adapter,
+        # so that a cached instance is always of the expected type.
+        # Keys are normalized to strings: SQLite repositories return IDs as str while
+        # callers (e.g. the API) pass uuid.UUID, and both must address the same entry.
+        self._energy_monitor_cache: BoundedCache[EntityId, EnergyMonitorPort] = BoundedCache(cache_max_size, key=str)
+        self._miner_controller_cache: BoundedCache[EntityId, MinerControlPort] = BoundedCache(cache_max_size, key=str)
+        self._notifier_cache: BoundedCache[EntityId, NotificationPort] = BoundedCache(cache_max_size, key=str)
+        self._forecast_provider_cache: BoundedCache[EntityId, ForecastProviderPort] = BoundedCache(
+            cache_max_size, key=str
+        )
+        self._home_forecast_provider_cache: BoundedCache[EntityId, HomeForecastProviderPort] = BoundedCache(
+            cache_max_size, key=str
+        )
+        self._mining_performance_tracker_cache: BoundedCache[EntityId, MiningPerformanceTrackerPort] = BoundedCache(
+            cache_max_size, key=str
+        )
         # Cache for already created external services
-        self._service_cache: Dict[EntityId, ExternalServicePort] = {}
+        self._service_cache: BoundedCache[EntityId, ExternalServicePort] = BoundedCache(cache_max_size, key=str)
 
         self.logger = logger
 
     def _initialize_external_service(self, external_service: ExternalService) -> Optional[ExternalServicePort]:
         """Initialize an external service"""
+        logger = self.logger
+        service_cache = self._service_cache
         # If the external service already exists, we use it
-        if external_service.id in self._service_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached instance "
-                    f"for external service ID {external_service.id} "
-                    f"(Type: {external_service.adapter_type})"
-                )
-            return self._service_cache[external_service.id]
+        cached_service = service_cache.get(external_service.id, _MISSING)
+        if cached_service is not _MISSING:
+            self._debug(
+                "Returning cached instance for external service ID %s (Type: %s)",
+                external_service.id,
+                external_service.adapter_type,
+            )
+            return cached_service
 
         try:
-            external_service_factory: Optional[ExternalServiceFactory] = None
-
-            if external_service.adapter_type == ExternalServiceAdapter.HOME_ASSISTANT_API:
-                # --- Home Assistant API ---
-
-                external_service_factory = ServiceHomeAssistantAPIFactory()
-            else:
+            external_service_factory = self._EXTERNAL_SERVICE_FACTORIES.get(external_service.adapter_type)
+            if external_service_factory is None:
                 raise ValueError(f"Unsupported external service type: {external_service.adapter_type}")
 
-            instance_service = external_service_factory.create(config=external_service.config, logger=self.logger)
+            instance_service = external_service_factory.create(config=external_service.config, logger=logger)
 
-            self._service_cache[external_service.id] = instance_service
+            service_cache[external_service.id] = instance_service
             return instance_service
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize External Service '{external_service.name}' "
                     f"(Type: {external_service.adapter_type}): {e}"
                 )
             return None
 
+    def _debug(self, msg: str, *args: Any) -> None:
+        """Log a debug message, formatting it only when debug logging is enabled."""
+        if self.logger and self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(msg % args if args else msg)
+
+    def _get_cached_adapter(
+        self, cache: BoundedCache[EntityId, Any], entity_id: EntityId, kind: str, adapter_type: Any
+    ) -> Any:
+        """Look up the cached adapter instance for entity_id, returning _MISSING if none has been cached yet."""
+        cached_instance = cache.get(entity_id, _MISSING)
+        if cached_instance is not _MISSING:
+            self._debug("Returning cached adapter instance for %s ID %s (Type: %s)", kind, entity_id, adapter_type)
+        return cached_instance
+
     def _initialize_energy_monitor_adapter(
         self, energy_source: EnergySource, energy_monitor: EnergyMonitor
     ) -> Optional[EnergyMonitorPort]:
         """Initialize an energy monitor adapter."""
         # If the adapter has already been created, we use it.
-        if energy_monitor.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance "
-                    f"for energy monitor ID {energy_monitor.id} "
-                    f"(Type: {energy_monitor.adapter_type})"
-                )
-
-            cached_instance = self._instance_cache[energy_monitor.id]
-
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for energy monitor ID {energy_monitor.id} is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, EnergyMonitorPort):
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for energy monitor ID {energy_monitor.id} "
-                        f"is not of type EnergyMonitorPort. Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._energy_monitor_cache
+        cached_instance = self._get_cached_adapter(
+            cache, energy_monitor.id, "energy monitor", energy_monitor.adapter_type
+        )
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         # Retrieve the external service associated to the energy monitor
+        external_service: Optional[ExternalServicePort] = None
         if energy_monitor.external_service_id:
             external_service = self.get_external_service(energy_monitor.external_service_id)
             if not external_service:
@@ -176,39 +302,26 @@ class AdapterService(AdapterServiceInterface):
                 )
 
         try:
-            energy_monitor_adapter_factory: Optional[EnergyMonitorAdapterFactory] = None
-
-            if energy_monitor.adapter_type == EnergyMonitorAdapter.DUMMY_SOLAR:
-                # --- Dummy Solar ---
-                if not energy_source:
-                    raise ValueError("EnergySource is required for DummySolar energy monitor.")
-
-                energy_monitor_adapter_factory = DummySolarEnergyMonitorFactory()
+            factory_class = self._ENERGY_MONITOR_FACTORIES.get(energy_monitor.adapter_type)
+            if factory_class is None:
+                raise ValueError(f"Unsupported energy monitor adapter type: {energy_monitor.adapter_type}")
 
-                # Set energy source as reference
-                energy_monitor_adapter_factory.from_energy_source(energy_source)
-            elif energy_monitor.adapter_type == EnergyMonitorAdapter.HOME_ASSISTANT_API:
-                # --- Home Assistant API ---
-                if not energy_monitor.config:
-                    raise ValueError("EnergyMonitor config is required for HomeAssistantAPI energy monitor.")
+            energy_monitor_adapter_factory = factory_class()
 
-                energy_monitor_adapter_factory = HomeAssistantAPIEnergyMonitorFactory()
-                # Actually HomeAssistantAPI Energy Monitor
-                # does not needs an energy source as reference
-            else:
-                raise ValueError(f"Unsupported energy monitor adapter type: {energy_monitor.adapter_type}")
+            # Set energy source as reference (factories that do not need it ignore it)
+            energy_monitor_adapter_factory.from_energy_source(energy_source)
 
             instance = energy_monitor_adapter_factory.create(
                 config=energy_monitor.config,
-                logger=self.logger,
+                logger=logger,
                 external_service=external_service,
             )
 
-            self._instance_cache[energy_monitor.id] = instance
+            cache[energy_monitor.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{energy_monitor.name}' "
                     f"(Type: {energy_monitor.adapter_type}) using factory: {e}"
                 )
@@ -219,37 +332,15 @@ class AdapterService(AdapterServiceInterface):
     ) -> Optional[MinerControlPort]:
         """Initialize a miner controller adapter."""
         # If the adapter has already been created, we use it.
-        if miner_controller.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance "
-                    f"for miner controller ID {miner_controller.id} "
-                    f"(Type: {miner_controller.adapter_type})"
-                )
-
-            cached_instance = self._instance_cache[miner_controller.id]
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for miner controller ID {miner_controller.id} "
-                        f"is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, MinerControlPort):
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for miner controller ID {miner_controller.id} "
-                        f"is not of type MinerControlPort. Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._miner_controller_cache
+        cached_instance = self._get_cached_adapter(
+            cache, miner_controller.id, "miner controller", miner_controller.adapter_type
+        )
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         # Retrieve the external service associated to the miner controller
         external_service: Optional[ExternalServicePort] = None
         if miner_controller.external_service_id:
@@ -261,50 +352,17 @@ class AdapterService(AdapterServiceInterface):
                 )
 
         try:
-            miner_controller_factory: Optional[MinerControllerAdapterFactory] = None
-            instance: Optional[MinerControlPort] = None
-
-            if miner_controller.adapter_type == MinerControllerAdapter.DUMMY:
-                if miner.power_consumption_max is None or miner.hash_rate_max is None:
-                    raise ValueError(
-                        "Miner power consumption max and hash rate max are required for DummyMinerController."
-                    )
-                # --- Dummy Controller ---
-                instance = DummyMinerController(
-                    power_max=miner.power_consumption_max,
-                    hashrate_max=miner.hash_rate_max,
-                    logger=self.logger,
-                )
-            elif miner_controller.adapter_type == MinerControllerAdapter.GENERIC_SOCKET_HOME_ASSISTANT_API:
-                # --- Generic Socket Home Assistant API Controller ---
-                miner_controller_factory = GenericSocketHomeAssistantAPIMinerControllerAdapterFactory()
-
-                miner_controller_factory.from_miner(miner)
-
-                instance = miner_controller_factory.create(
-                    config=miner_controller.config,
-                    logger=self.logger,
-                    external_service=external_service,
-                )
-            elif miner_controller.adapter_type == MinerControllerAdapter.PYASIC:
-                # --- PyASIC Controller ---
-                miner_controller_factory = PyASICMinerControllerAdapterFactory()
-
-                miner_controller_factory.from_miner(miner)
-
-                instance = miner_controller_factory.create(
-                    config=miner_controller.config,
-                    logger=self.logger,
-                    external_service=external_service,
-                )
-            else:
+            builder = self._MINER_CONTROLLER_BUILDERS.get(miner_controller.adapter_type)
+            if builder is None:
                 raise ValueError(f"Unsupported miner controller adapter type: {miner_controller.adapter_type}")
 
-            self._instance_cache[miner_controller.id] = instance
+            instance = builder(miner, miner_controller, logger, external_service)
+
+            cache[miner_controller.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{miner_controller.name}' "
                     f"(Type: {miner_controller.adapter_type}) using factory: {e}"
                 )
@@ -313,36 +371,15 @@ class AdapterService(AdapterServiceInterface):
     def _initialize_notifier_adapter(self, notifier: Notifier) -> Optional[NotificationPort]:
         """Initialize a notifier adapter."""
         # If the adapter has already been created, we use it.
-        if notifier.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance for notifier ID {notifier.id} (Type: {notifier.adapter_type})"
-                )
-
-            cached_instance = self._instance_cache[notifier.id]
-
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for notifier ID {notifier.id} is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, NotificationPort):
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for notifier ID {notifier.id} "
-                        f"is not of type NotificationPort. Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._notifier_cache
+        cached_instance = self._get_cached_adapter(cache, notifier.id, "notifier", notifier.adapter_type)
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         # Retrieve the external service associated to the notifier
+        external_service: Optional[ExternalServicePort] = None
         if notifier.external_service_id:
             external_service = self.get_external_service(notifier.external_service_id)
             if not external_service:
@@ -350,26 +387,17 @@ class AdapterService(AdapterServiceInterface):
                     f"Unable to load external service {notifier.external_service_id} for notifier {notifier.name}"
                 )
         try:
-            instance: Optional[NotificationPort] = None
-
-            if notifier.adapter_type == NotificationAdapter.DUMMY:
-                # --- Dummy Notifier ---
-                instance = DummyNotifier()
-            elif notifier.adapter_type == NotificationAdapter.TELEGRAM:
-                # --- Telegram Notifier ---
-                instance = TelegramNotifierFactory().create(
-                    config=notifier.config,
-                    logger=self.logger,
-                    external_service=external_service,
-                )
-            else:
+            builder = self._NOTIFIER_BUILDERS.get(notifier.adapter_type)
+            if builder is None:
                 raise ValueError(f"Unsupported notifier adapter type: {notifier.adapter_type}")
 
-            self._instance_cache[notifier.id] = instance
+            instance = builder(notifier, logger, external_service)
+
+            cache[notifier.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{notifier.name}' (Type: {notifier.adapter_type}) using factory: {e}"
                 )
             return None
@@ -379,40 +407,17 @@ class AdapterService(AdapterServiceInterface):
     ) -> Optional[ForecastProviderPort]:
         """Initialize a forecast provider adapter."""
         # If the adapter has already been created, we use it.
-        if forecast_provider.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance "
-                    f"for forecast provider ID {forecast_provider.id} "
-                    f"(Type: {forecast_provider.adapter_type})"
-                )
-            cached_instance = self._instance_cache[forecast_provider.id]
-
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        "Cached instance for forecast provider "
-                        f"ID {forecast_provider.id} "
-                        f"is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, ForecastProviderPort):
-                if self.logger:
-                    self.logger.warning(
-                        "Cached instance for forecast provider "
-                        f"ID {forecast_provider.id} "
-                        f"is not of type ForecastProviderPort. Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._forecast_provider_cache
+        cached_instance = self._get_cached_adapter(
+            cache, forecast_provider.id, "forecast provider", forecast_provider.adapter_type
+        )
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         # Retrieve the external service associated to the forecast provider
+        external_service: Optional[ExternalServicePort] = None
         if forecast_provider.external_service_id:
             external_service = self.get_external_service(forecast_provider.external_service_id)
             if not external_service:
@@ -422,37 +427,26 @@ class AdapterService(AdapterServiceInterface):
                 )
 
         try:
-            forecast_provider_adapter_factory: Optional[ForecastAdapterFactory] = None
-
-            if forecast_provider.adapter_type == ForecastProviderAdapter.DUMMY_SOLAR:
-                # --- Dummy Forecast Provider ---
-                if not energy_source:
-                    raise ValueError("EnergySource is required for DummySolar forecast provider.")
+            factory_class = self._FORECAST_PROVIDER_FACTORIES.get(forecast_provider.adapter_type)
+            if factory_class is None:
+                raise ValueError(f"Unsupported forecast provider adapter type: {forecast_provider.adapter_type}")
 
-                forecast_provider_adapter_factory = DummyForecastProviderFactory()
+            forecast_provider_adapter_factory = factory_class()
 
-                # Set energy source as reference
-                forecast_provider_adapter_factory.from_energy_source(energy_source)
-            elif forecast_provider.adapter_type == ForecastProviderAdapter.HOME_ASSISTANT_API:
-                # --- Home Assistant API Forecast Provider ---
-                if not forecast_provider.config:
-                    raise ValueError("ForecastProvider config is required for HomeAssistantAPI forecast provider.")
-
-                forecast_provider_adapter_factory = HomeAssistantForecastProviderFactory()
-            else:
-                raise ValueError(f"Unsupported forecast provider adapter type: {forecast_provider.adapter_type}")
+            # Set energy source as reference (factories that do not need it ignore it)
+            forecast_provider_adapter_factory.from_energy_source(energy_source)
 
             instance = forecast_provider_adapter_factory.create(
                 config=forecast_provider.config,
-                logger=self.logger,
+                logger=logger,
                 external_service=external_service,
             )
 
-            self._instance_cache[forecast_provider.id] = instance
+            cache[forecast_provider.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{forecast_provider.name}' "
                     f"(Type: {forecast_provider.adapter_type}) using factory: {e}"
                 )
@@ -463,54 +457,29 @@ class AdapterService(AdapterServiceInterface):
     ) -> Optional[HomeForecastProviderPort]:
         """Initialize a home forecast provider adapter."""
         # If the adapter has already been created, we use it.
-        if home_forecast_provider.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance "
-                    f"for home forecast provider ID {home_forecast_provider.id} "
-                    f"(Type: {home_forecast_provider.adapter_type})"
-                )
-            cached_instance = self._instance_cache[home_forecast_provider.id]
-
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for home forecast provider ID "
-                        f"{home_forecast_provider.id} is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, HomeForecastProviderPort):
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for home forecast provider ID "
-                        f"{home_forecast_provider.id} is not of type HomeForecastProviderPort. "
-                        "Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._home_forecast_provider_cache
+        cached_instance = self._get_cached_adapter(
+            cache, home_forecast_provider.id, "home forecast provider", home_forecast_provider.adapter_type
+        )
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         try:
-            if home_forecast_provider.adapter_type == HomeForecastProviderAdapter.DUMMY:
-                # --- Dummy Home Forecast Provider ---
-                # TODO - Add configuration parameters for DummyHomeForecastProvider
-                # For now, we use a default load power max of 800W.
-                instance = DummyHomeForecastProvider(load_power_max=800)
-            else:
+            builder = self._HOME_FORECAST_PROVIDER_BUILDERS.get(home_forecast_provider.adapter_type)
+            if builder is None:
                 raise ValueError(
                     f"Unsupported home forecast provider adapter type: {home_forecast_provider.adapter_type}"
                 )
 
-            self._instance_cache[home_forecast_provider.id] = instance
+            instance = builder(home_forecast_provider, logger)
+
+            cache[home_forecast_provider.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{home_forecast_provider.name}' "
                     f"(Type: {home_forecast_provider.adapter_type}) using factory: {e}"
                 )
@@ -521,38 +490,17 @@ class AdapterService(AdapterServiceInterface):
     ) -> Optional[MiningPerformanceTrackerPort]:
         """Initialize a mining performance tracker adapter."""
         # If the adapter has already been created, we use it.
-        if tracker.id in self._instance_cache:
-            if self.logger:
-                self.logger.debug(
-                    f"Returning cached adapter instance "
-                    f"for mining performance tracker ID {tracker.id} "
-                    f"(Type: {tracker.adapter_type})"
-                )
-            cached_instance = self._instance_cache[tracker.id]
-
-            if not cached_instance:
-                # If the cached instance is None, we return it
-                # to indicate that the adapter was not initialized.
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for mining performance tracker ID {tracker.id} "
-                        f"is None. Reinitializing adapter."
-                    )
-                return None
-
-            # Check if the cached instance is of the correct type
-            if not isinstance(cached_instance, MiningPerformanceTrackerPort):
-                if self.logger:
-                    self.logger.warning(
-                        f"Cached instance for mining performance tracker ID {tracker.id} "
-                        f"is not of type MiningPerformanceTrackerPort. Reinitializing adapter."
-                    )
-                return None
-
-            # If the cached instance is valid, we return it
+        cache = self._mining_performance_tracker_cache
+        cached_instance = self._get_cached_adapter(
+            cache, tracker.id, "mining performance tracker", tracker.adapter_type
+        )
+        if cached_instance is not _MISSING:
             return cached_instance
 
+        logger = self.logger
+
         # Retrieve the external service associated to the energy monitor
+        external_service: Optional[ExternalServicePort] = None
         if tracker.external_service_id:
             external_service = self.get_external_service(tracker.external_service_id)
             if not external_service:
@@ -562,44 +510,53 @@ class AdapterService(AdapterServiceInterface):
                 )
 
         try:
-            instance: Optional[MiningPerformanceTrackerPort] = None
-
-            # No configuration is needed for the dummy tracker.
-            # We instantiate it directly using DummyMiningPerformanceTracker.
-            # In the future, if we may have other types of trackers
-            # that require different initialization logic, we can use
-            # a factory pattern similar to the other adapters.
-
-            if tracker.adapter_type == MiningPerformanceTrackerAdapter.DUMMY:
-                # --- Dummy Tracker ---
-
-                instance = DummyMiningPerformanceTracker()
-            else:
+            builder = self._MINING_PERFORMANCE_TRACKER_BUILDERS.get(tracker.adapter_type)
+            if builder is None:
                 raise ValueError(f"Unsupported mining performance tracker adapter type: {tracker.adapter_type}")
 
-            self._instance_cache[tracker.id] = instance
+            instance = builder(tracker, logger, external_service)
+
+            cache[tracker.id] = instance
             return instance
         except Exception as e:
-            if self.logger:
-                self.logger.error(
+            if logger:
+                logger.error(
                     f"Failed to initialize adapter '{tracker.name}' (Type: {tracker.adapter_type}) using factory: {e}"
                 )
             return None
 
+    def _get_adapter(
+        self,
+        entity_id: EntityId,
+        load: Callable[[EntityId], Any],
+        initialize: Callable[[Any], Any],
+        not_found_message: str,
+    ) -> Any:
+        """
+        Load an entity from its repository and return its adapter instance, or None if the
+        entity does not exist. The initializer returns the cached instance when there is one.
+        """
+        # The repository is always checked, so that an entity removed outside of the
+        # configuration service is never served from a stale cached adapter
+        entity = load(entity_id)
+        if not entity:
+            if self.logger:
+                self.logger.error(not_found_message.format(entity_id))
+            return None
+        return initialize(entity)
+
     def get_energy_monitor(self, energy_source: EnergySource) -> Optional[EnergyMonitorPort]:
         """Get an energy monitor adapter instance."""
         if not energy_source.energy_monitor_id:
             if self.logger:
                 self.logger.error(f"EnergySource {energy_source.name} does not have an associated EnergyMonitor ID.")
             return None
-        energy_monitor = self.energy_monitor_repo.get_by_id(energy_source.energy_monitor_id)
-        if not energy_monitor:
-            if self.logger:
-                self.logger.error(
-                    f"EnergyMonitor ID {energy_source.energy_monitor_id} not found or not an EnergyMonitor."
-                )
-            return None
-        return self._initialize_energy_monitor_adapter(energy_source, energy_monitor)
+        return self._get_adapter(
+            energy_source.energy_monitor_id,
+            self.energy_monitor_repo.get_by_id,
+            lambda energy_monitor: self._initialize_energy_monitor_adapter(energy_source, energy_monitor),
+            "EnergyMonitor ID {} not found or not an EnergyMonitor.",
+        )
 
     def get_miner_controller(self, miner: Miner) -> Optional[MinerControlPort]:
         """Get a miner controller adapter instance"""
@@ -607,45 +564,54 @@ class AdapterService(AdapterServiceInterface):
             if self.logger:
                 self.logger.error(f"Miner {miner.name} does not have an associated MinerController ID.")
             return None
-        miner_controller = self.miner_controller_repo.get_by_id(miner.controller_id)
-        if not miner_controller:
-            if self.logger:
-                self.logger.error(f"Miner Controller ID {miner.controller_id} not found or not a MinerController.")
-            return None
-        return self._initialize_miner_controller_adapter(miner, miner_controller)
+        return self._get_adapter(
+            miner.controller_id,
+            self.miner_controller_repo.get_by_id,
+            lambda miner_controller: self._initialize_miner_controller_adapter(miner, miner_controller),
+            "Miner Controller ID {} not found or not a MinerController.",
+        )
 
     def get_all_notifiers(self) -> List[NotificationPort]:
         """Get all notifier adapter instances"""
-        notifier_instances = []
         notifiers = self.notifier_repo.get_all()
-        if not notifiers or not len(notifiers) > 0:
+        if not notifiers:
             if self.logger:
                 self.logger.error("Notifiers not configured.")
             return []
 
-        for notifier in notifiers:
-            instance = self._initialize_notifier_adapter(notifier)
-            if instance:
-                notifier_instances.append(instance)
-            else:
-                if self.logger:
-                    self.logger.warning(f"Notifier ID {notifier.id} not found or not a Notification category.")
-        return notifier_instances
+        # Resolve each external service once up front: notifiers sharing it are then served
+        # from the cache, and one that cannot be loaded is not retried for every notifier.
+        unavailable_services = {
+            external_service_id
+            for external_service_id in {notifier.external_service_id for notifier in notifiers}
+            if external_service_id and not self.get_external_service(external_service_id)
+        }
+        if unavailable_services:
+            if self.logger:
+                self.logger.warning(
+                    f"Skipping notifiers of unavailable external services: {sorted(map(str, unavailable_services))}"
+                )
+            notifiers = [notifier for notifier in notifiers if notifier.external_service_id not in unavailable_services]
+
+        # Adapters that fail to initialize are logged by _initialize_notifier_adapter and left out
+        return list(filter(None, map(self._initialize_notifier_adapter, notifiers)))
 
     def get_notifier(self, notifier_id: EntityId) -> Optional[NotificationPort]:
         """Get a specific notifier adapter instance by ID."""
-        notifier = self.notifier_repo.get_by_id(notifier_id)
-        if not notifier:
-            if self.logger:
-                self.logger.error(f"Notifier ID {notifier_id} not found or not a Notifier.")
-            return None
-        return self._initialize_notifier_adapter(notifier)
+        return self._get_adapter(
+            notifier_id,
+            self.notifier_repo.get_by_id,
+            self._initialize_notifier_adapter,
+            "Notifier ID {} not found or not a Notifier.",
+        )
 
     def get_notifiers(self, notifier_ids: List[EntityId]) -> List[NotificationPort]:
         """Get a list of specific notifier adapter instances by IDs."""
         notifier_instances: List[NotificationPort] = []
+        # One repository lookup for the whole list, iterated in the requested order
+        notifiers = self.notifier_repo.get_by_ids(notifier_ids)
         for notifier_id in notifier_ids:
-            notifier = self.notifier_repo.get_by_id(notifier_id)
+            notifier = notifiers.get(notifier_id)
             if not notifier:
                 if self.logger:
                     self.logger.error(f"Notifier ID {notifier_id} not found or not a Notifier.")
@@ -665,87 +631,138 @@ class AdapterService(AdapterServiceInterface):
             if self.logger:
                 self.logger.error(f"EnergySource {energy_source.name} does not have an associated ForecastProvider ID.")
             return None
-        forecast_provider = self.forecast_provider_repo.get_by_id(energy_source.forecast_provider_id)
-        if not forecast_provider:
-            if self.logger:
-                self.logger.error(
-                    f"Forecast Provider ID {energy_source.forecast_provider_id} not found or not a Forecast Provider."
-                )
-            return None
-        return self._initialize_forecast_provider_adapter(energy_source, forecast_provider)
+        return self._get_adapter(
+            energy_source.forecast_provider_id,
+            self.forecast_provider_repo.get_by_id,
+            lambda forecast_provider: self._initialize_forecast_provider_adapter(energy_source, forecast_provider),
+            "Forecast Provider ID {} not found or not a Forecast Provider.",
+        )
 
     def get_home_load_forecast_provider(
         self, home_forecast_provider_id: EntityId
     ) -> Optional[HomeForecastProviderPort]:
         """Get an home load forecast provider adapter instance."""
-        home_forecast_provider = self.home_forecast_provider_repo.get_by_id(home_forecast_provider_id)
-        if not home_forecast_provider:
-            if self.logger:
-                self.logger.error(
-                    f"Home Forecast Provider ID {home_forecast_provider_id} not found or not a Home Forecast Provider."
-                )
-            return None
-        return self._initialize_home_forecast_provider_adapter(home_forecast_provider)
+        return self._get_adapter(
+            home_forecast_provider_id,
+            self.home_forecast_provider_repo.get_by_id,
+            self._initialize_home_forecast_provider_adapter,
+            "Home Forecast Provider ID {} not found or not a Home Forecast Provider.",
+        )
 
     def get_mining_performance_tracker(self, tracker_id: EntityId) -> Optional[MiningPerformanceTrackerPort]:
         """Get a mining performance tracker adapter instance."""
-        tracker = self.mining_performance_tracker_repo.get_by_id(tracker_id)
-        if not tracker:
-            if self.logger:
-                self.logger.error(
-                    f"Mining Performance Tracker ID {tracker_id} not found or not a Mining Performance Tracker."
-                )
-            return None
-        return self._initialize_mining_performance_tracker_adapter(tracker)
+        return self._get_adapter(
+            tracker_id,
+            self.mining_performance_tracker_repo.get_by_id,
+            self._initialize_mining_performance_tracker_adapter,
+            "Mining Performance Tracker ID {} not found or not a Mining Performance Tracker.",
+        )
 
     def get_external_service(self, external_service_id: EntityId) -> Optional[ExternalServicePort]:
         """Get a specific external service instance by ID."""
-        external_service = self.external_service_repo.get_by_id(external_service_id)
-        if not external_service:
-            if self.logger:
-                self.logger.error(f"External Service ID {external_service_id} not found or not an External Service.")
-            return None
-        return self._initialize_external_service(external_service)
+        return self._get_adapter(
+            external_service_id,
+            self.external_service_repo.get_by_id,
+            self._initialize_external_service,
+            "External Service ID {} not found or not an External Service.",
+        )
 
     def get_rule_engine(self) -> Optional[RuleEngine]:
         """Creates a new Rule Engine instance."""
         try:
             # For now, we default to the 'custom' engine.
             # This could be driven by configuration in the future.
-            factory = RuleEngineFactory()
-            engine = factory.create(engine_type=RuleEngineType.CUSTOM, logger=self.logger)
+            engine = self._RULE_ENGINE_FACTORY.create(engine_type=RuleEngineType.CUSTOM, logger=self.logger)
             return engine
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Failed to create RuleEngine instance: {e}")
             return None
 
+    def _adapter_caches(self) -> List[BoundedCache[EntityId, Any]]:
+        """Return the adapter instance caches of every kind."""
+        return [
+            self._energy_monitor_cache,
+            self._miner_controller_cache,
+            self._notifier_cache,
+            self._forecast_provider_cache,
+            self._home_forecast_provider_cache,
+            self._mining_performance_tracker_cache,
+        ]
+
     def clear_all_adapters(self):
         """Clear adapter cache"""
         if self.logger:
             self.logger.info("Clearing all adapters.")
-        self._instance_cache = {}  # Reset the cache
+        for cache in self._adapter_caches():
+            cache.clear()
 
     def remove_adapter(self, entity_id: EntityId):
         """Remove a specific adapter from the cache."""
-        if entity_id in self._instance_cache:
-            del self._instance_cache[entity_id]
+        removed = [cache.pop(entity_id, _MISSING) for cache in self._adapter_caches()]
+        if any(instance is not _MISSING for instance in removed):
             if self.logger:
                 self.logger.info(f"Removed adapter with ID {entity_id} from cache.")
         else:
             if self.logger:
                 self.logger.warning(f"No adapter found with ID {entity_id} to remove.")
 
+    def invalidate(self, entity_id: EntityId) -> None:
+        """
+        Drop the cached adapter instance of an entity, if any, so that the next
+        request builds it again from the current configuration in the repository.
+        """
+        for cache in self._adapter_caches():
+            if cache.invalidate(entity_id):
+                self._debug("Invalidated cached adapter instance for ID %s", entity_id)
+
+    def invalidate_external_service(self, external_service_id: EntityId) -> None:
+        """Drop the cached instance of an external service, if any."""
+        if self._service_cache.invalidate(external_service_id):
+            self._debug("Invalidated cached external service instance for ID %s", external_service_id)
+
+    def invalidate_cascade(self, external_service_id: EntityId) -> None:
+        """
+        Drop the cached instance of an external service together with the cached
+        adapters of every entity linked to it, which hold a reference to the old instance.
+        """
+        self.invalidate_external_service(external_service_id)
+
+        linked_entities = [
+            (self._energy_monitor_cache, self.energy_monitor_repo.get_by_external_service_id(external_service_id)),
+            (self._miner_controller_cache, self.miner_controller_repo.get_by_external_service_id(external_service_id)),
+            (self._notifier_cache, self.notifier_repo.get_by_external_service_id(external_service_id)),
+            (
+                self._forecast_provider_cache,
+                self.forecast_provider_repo.get_by_external_service_id(external_service_id),
+            ),
+            (
+                self._home_forecast_provider_cache,
+                self.home_forecast_provider_repo.get_by_external_service_id(external_service_id),
+            ),
+            (
+                self._mining_performance_tracker_cache,
+                self.mining_performance_tracker_repo.get_by_external_service_id(external_service_id),
+            ),
+        ]
+        for cache, entities in linked_entities:
+            for entity in entities:
+                if cache.invalidate(entity.id):
+                    self._debug(
+                        "Invalidated cached adapter instance for ID %s linked to external service %s",
+                        entity.id,
+                        external_service_id,
+                    )
+
     def clear_all_services(self):
         """Clear external services cache"""
         if self.logger:
             self.logger.info("Clearing all external services.")
-        self._service_cache = {}  # Reset the cache
+        self._service_cache.clear()
 
     def remove_service(self, external_service_id: EntityId):
         """Remove a specific external service from the cache."""
-        if external_service_id in self._service_cache:
-            del self._service_cache[external_service_id]
+        if self._service_cache.pop(external_service_id, _MISSING) is not _MISSING:
             if self.logger:
                 self.logger.info(f"Removed external service with ID {external_service_id} from cache.")
         else:
@@ -4,7 +4,7 @@ Configuration service for managing all domain entities of edge mining applicatio
 
 from typing import Any, Dict, List, Optional
 
-from edge_mining.application.interfaces import ConfigurationServiceInterface
+from edge_mining.application.interfaces import AdapterServiceInterface, ConfigurationServiceInterface
 from edge_mining.domain.common import EntityId, Watts
 from edge_mining.domain.energy.common import EnergyMonitorAdapter, EnergySourceType
 from edge_mining.domain.energy.entities import EnergyMonitor, EnergySource
@@ -89,7 +89,12 @@ from edge_mining.shared.settings.ports import SettingsRepository
 class ConfigurationService(ConfigurationServiceInterface):
     """Handles configuration of miners, policies, and system settings."""
 
-    def __init__(self, persistence_settings: PersistenceSettings, logger: LoggerPort):
+    def __init__(
+        self,
+        persistence_settings: PersistenceSettings,
+        logger: LoggerPort,
+        adapter_service: Optional[AdapterServiceInterface] = None,
+    ):
         # Domains
         self.external_service_repo: ExternalServiceRepository = persistence_settings.external_service_repo
         self.energy_source_repo: EnergySourceRepository = persistence_settings.energy_source_repo
@@ -111,6 +116,19 @@ class ConfigurationService(ConfigurationServiceInterface):
         # Infrastructure
         self.logger = logger
 
+        # Adapter cache to invalidate when an entity backing an adapter changes
+        self.adapter_service = adapter_service
+
+    def _invalidate_adapter(self, entity_id: EntityId) -> None:
+        """Drop the cached adapter instance of an updated or removed entity."""
+        if self.adapter_service:
+            self.adapter_service.invalidate(entity_id)
+
+    def _invalidate_external_service(self, service_id: EntityId) -> None:
+        """Drop the cached instance of an external service and of the adapters linked to it."""
+        if self.adapter_service:
+            self.adapter_service.invalidate_cascade(service_id)
+
     # --- External Service Management ---
     def create_external_service(
         self,
@@ -165,6 +183,9 @@ class ConfigurationService(ConfigurationServiceInterface):
         """Remove the association of an external service from all entities."""
         self.logger.debug(f"Unlinking external service {service_id}")
 
+        # Invalidated while the entities are still linked, so the cascade can find them
+        self._invalidate_external_service(service_id)
+
         # Get entities associated with this external service
         external_service_linked_entities = self.get_entities_by_external_service(service_id)
 
@@ -248,6 +269,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.check_external_service(external_service)
 
         self.external_service_repo.update(external_service)
+        self._invalidate_external_service(service_id)
 
         return external_service
 
@@ -487,6 +509,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.unlink_energy_monitor(monitor_id)
 
         self.energy_monitor_repo.remove(monitor_id)
+        self._invalidate_adapter(monitor_id)
 
         return energy_monitor
 
@@ -521,6 +544,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.check_energy_monitor(energy_monitor)
 
         self.energy_monitor_repo.update(energy_monitor)
+        self._invalidate_adapter(monitor_id)
 
         return energy_monitor
 
@@ -674,6 +698,7 @@ class ConfigurationService(ConfigurationServiceInterface):
             raise ForecastProviderNotFoundError(f"Forecast Provider with ID {provider_id} not found.")
 
         self.forecast_provider_repo.remove(provider_id)
+        self._invalidate_adapter(provider_id)
 
         return forecast_provider
 
@@ -701,6 +726,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.check_forecast_provider(forecast_provider)
 
         self.forecast_provider_repo.update(forecast_provider)
+        self._invalidate_adapter(provider_id)
 
         return forecast_provider
 
@@ -1309,6 +1335,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.unlink_miner_controller(controller_id)
 
         self.miner_controller_repo.remove(controller_id)
+        self._invalidate_adapter(controller_id)
 
         return controller
 
@@ -1347,6 +1374,7 @@ class ConfigurationService(ConfigurationServiceInterface):
         self.check_miner_controller(controller)
 
         self.miner_controller_repo.update(controller)
+        self._invalidate_adapter(controller_id)
 
         return controller
 
@@ -1434,6 +1462,7 @@ class ConfigurationService(ConfigurationServiceInterface):
             raise NotifierNotFoundError(f"Notifier with ID {notifier_id} not found.")
 
         self.notifier_repo.remove(notifier_id)
+        self._invalidate_adapter(notifier_id)
         return notifier
 
     def update_notifier(
@@ -1450,12 +1479,50 @@ class ConfigurationService(ConfigurationServiceInterface):
         if not notifier:
             raise NotifierNotFoundError(f"Notifier with ID {notifier_id} not found.")
 
+        return self._apply_notifier_update(notifier, name, config, external_service_id)
+
+    def update_notifier_from_dict(
+        self,
+        notifier_id: EntityId,
+        name: str,
+        config_data: Optional[dict],
+        external_service_id: Optional[EntityId] = None,
+    ) -> Notifier:
+        """Update a notifier in the system, building its configuration from a dictionary."""
+        self.logger.debug(f"Updating notifier {notifier_id} ({name})")
+
+        notifier = self.notifier_repo.get_by_id(notifier_id)
+        if not notifier:
+            raise NotifierNotFoundError(f"Notifier with ID {notifier_id} not found.")
+
+        # The configuration class depends on the stored adapter type,
+        # resolve it from the notifier fetched above
+        config: Optional[NotificationConfig] = None
+        if config_data:
+            config_cls = self.get_notifier_config_by_type(notifier.adapter_type)
+            if config_cls is None:
+                raise NotifierConfigurationError(
+                    f"No configuration class found for adapter type {notifier.adapter_type}"
+                )
+            config = config_cls.from_dict(config_data)
+
+        return self._apply_notifier_update(notifier, name, config, external_service_id)
+
+    def _apply_notifier_update(
+        self,
+        notifier: Notifier,
+        name: str,
+        config: Optional[NotificationConfig],
+        external_service_id: Optional[EntityId],
+    ) -> Notifier:
+        """Apply the updated fields to a notifier, check it and persist it."""
         notifier.name = name
         notifier.config = config
         notifier.external_service_id = external_service_id
 
         self.check_notifier(notifier)
         self.notifier_repo.update(notifier)
+        self._invalidate_adapter(notifier.id)
 
         return notifier
 
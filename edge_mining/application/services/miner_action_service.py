@@ -59,15 +59,15 @@ class MinerActionService(MinerActionServiceInterface):
             raise MinerControllerConfigurationError(f"Miner controller for miner {miner_id} is not configured.")
 
         # Update miner status using controller
-        current_status = miner_controller.get_miner_status()
-        current_hashrate = miner_controller.get_miner_hashrate()
-        current_power = miner_controller.get_miner_power()
+        current_status = await miner_controller.aget_miner_status()
+        current_hashrate = await miner_controller.aget_miner_hashrate()
+        current_power = await miner_controller.aget_miner_power()
         miner.update_status(current_status, current_hashrate, current_power)
 
         # Persist the observed state
         self.miner_repo.update(miner)
 
-        success = miner_controller.start_miner()
+        success = await miner_controller.astart_miner()
 
         if success:
             if self.logger:
@@ -105,15 +105,15 @@ class MinerActionService(MinerActionServiceInterface):
             raise MinerControllerConfigurationError(f"Miner controller for miner {miner_id} is not configured.")
 
         # Update miner status using controller
-        current_status = miner_controller.get_miner_status()
-        current_hashrate = miner_controller.get_miner_hashrate()
-        current_power = miner_controller.get_miner_power()
+        current_status = await miner_controller.aget_miner_status()
+        current_hashrate = await miner_controller.aget_miner_hashrate()
+        current_power = await miner_controller.aget_miner_power()
         miner.update_status(current_status, current_hashrate, current_power)
 
         # Persist the observed state
         self.miner_repo.update(miner)
 
-        success = miner_controller.stop_miner()
+        success = await miner_controller.astop_miner()
 
         if success:
             if self.logger:
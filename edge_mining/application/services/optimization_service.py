@@ -627,9 +627,9 @@ class OptimizationService(OptimizationServiceInterface):
         # Get current status and make decision
         try:
             # Update miner status using controller
-            current_status = miner_controller.get_miner_status()
-            current_hashrate = miner_controller.get_miner_hashrate()
-            current_power = miner_controller.get_miner_power()
+            current_status = await miner_controller.aget_miner_status()
+            current_hashrate = await miner_controller.aget_miner_hashrate()
+            current_power = await miner_controller.aget_miner_power()
 
             # Update the domain model
             miner.update_status(
@@ -726,7 +726,7 @@ class OptimizationService(OptimizationServiceInterface):
         if decision == MiningDecision.START_MINING and current_status != MinerStatus.ON:
             if self.logger:
                 self.logger.info(f"Executing START for miner {miner_id} via {type(controller).__name__}")
-            success = controller.start_miner()
+            success = await controller.astart_miner()
             action_taken = True
             if success:
                 await self._notify_unit(
@@ -744,7 +744,7 @@ class OptimizationService(OptimizationServiceInterface):
         elif decision == MiningDecision.STOP_MINING and current_status == MinerStatus.ON:
             if self.logger:
                 self.logger.info(f"Executing STOP for miner {miner_id} via {type(controller).__name__}")
-            success = controller.stop_miner()
+            success = await controller.astop_miner()
             action_taken = True
             if success:
                 await self._notify_unit(
@@ -243,7 +243,11 @@ def configure_dependencies(logger: LoggerPort, settings: AppSettings) -> Service
         logger=logger,
     )
 
-    config_service = ConfigurationService(persistence_settings=persistence_settings, logger=logger)
+    config_service = ConfigurationService(
+        persistence_settings=persistence_settings,
+        logger=logger,
+        adapter_service=adapter_service,
+    )
 
     services = Services(
         adapter_service=adapter_service,
@@ -1,5 +1,6 @@
 """Collection of Ports for the Mining Device Management domain of the Edge Mining application."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
@@ -37,6 +38,30 @@ class MinerControlPort(ABC):
         """Gets the current hash rate, if available."""
         raise NotImplementedError
 
+    # Async variants for callers already running on an event loop. By default they run
+    # the synchronous method in a worker thread; adapters backed by an async client
+    # override them to await it directly.
+
+    async def astart_miner(self) -> bool:
+        """Async variant of start_miner."""
+        return await asyncio.to_thread(self.start_miner)
+
+    async def astop_miner(self) -> bool:
+        """Async variant of stop_miner."""
+        return await asyncio.to_thread(self.stop_miner)
+
+    async def aget_miner_status(self) -> MinerStatus:
+        """Async variant of get_miner_status."""
+        return await asyncio.to_thread(self.get_miner_status)
+
+    async def aget_miner_power(self) -> Optional[Watts]:
+        """Async variant of get_miner_power."""
+        return await asyncio.to_thread(self.get_miner_power)
+
+    async def aget_miner_hashrate(self) -> Optional[HashRate]:
+        """Async variant of get_miner_hashrate."""
+        return await asyncio.to_thread(self.get_miner_hashrate)
+
 
 class MinerRepository(ABC):
     """Port for the Miner Repository."""
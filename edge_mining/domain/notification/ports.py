@@ -3,7 +3,7 @@
 # Is it really necessary to have a domain dedicated to the notification service?
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from edge_mining.domain.common import EntityId
 from edge_mining.domain.notification.entities import Notifier
@@ -31,6 +31,11 @@ class NotifierRepository(ABC):
         """Retrieves an notifier by its ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    def get_by_ids(self, notifier_ids: List[EntityId]) -> Dict[EntityId, Notifier]:
+        """Retrieves the notifiers with the given IDs, keyed by ID. Missing IDs are left out."""
+        raise NotImplementedError
+
     @abstractmethod
     def get_all(self) -> List[Notifier]:
         """Retrieves all notifiers from the repository."""
@@ -93,6 +93,8 @@ class MinerControllerPyASICConfig(MinerControllerConfig):
     username: Optional[str] = field(default=None)  # None represents "use the default"
     password: Optional[str] = field(default=None)  # None represents "use the default"
     protocol: MinerControllerProtocol = field(default=MinerControllerProtocol.WEB)
+    discovery_ttl: float = field(default=60.0)  # Seconds before the miner is discovered again
+    metrics_ttl: float = field(default=2.0)  # Seconds the hashrate, power and status readings are reused
 
     def is_valid(self, adapter_type: MinerControllerAdapter) -> bool:
         """
@@ -131,4 +133,6 @@ class MinerControllerPyASICConfig(MinerControllerConfig):
             username=data.get("username", None),
             password=data.get("password", None),
             protocol=protocol,
+            discovery_ttl=data.get("discovery_ttl", 60.0),
+            metrics_ttl=data.get("metrics_ttl", 2.0),
         )
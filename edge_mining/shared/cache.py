@@ -0,0 +1,80 @@
+"""Bounded in-memory cache shared by the services of the Edge Mining application."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Private marker for a missing entry, distinct from any value a caller may store or pass as default
+_ABSENT = object()
+
+
+def _identity(key: Any) -> Any:
+    """Default key function, using keys as they are."""
+    return key
+
+
+class BoundedCache(Generic[K, V]):
+    """
+    Thread-safe LRU mapping holding at most maxsize entries.
+
+    Reading an entry marks it as most recently used; storing a new entry
+    beyond maxsize evicts the least recently used one, so long-running
+    processes do not keep instances for entities that are no longer used.
+
+    When key is given, every key is passed through it before being stored or
+    looked up, so that equivalent keys of different types (e.g. a UUID and its
+    string form) address the same entry.
+    """
+
+    def __init__(self, maxsize: int = 128, key: Optional[Callable[[Any], Hashable]] = None):
+        self.maxsize = maxsize
+        self._key: Callable[[Any], Hashable] = key or _identity
+        self._entries: "OrderedDict[Hashable, V]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K, default: Any = None) -> Any:
+        """Return the value for key, or default if it is not cached."""
+        key = self._key(key)
+        with self._lock:
+            value = self._entries.get(key, _ABSENT)
+            if value is _ABSENT:
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        key = self._key(key)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __contains__(self, key: object) -> bool:
+        key = self._key(key)
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def pop(self, key: K, default: Any = None) -> Any:
+        """Remove key and return its value, or default if it is not cached."""
+        key = self._key(key)
+        with self._lock:
+            return self._entries.pop(key, default)
+
+    def invalidate(self, key: K) -> bool:
+        """Remove key, returning whether it was cached."""
+        key = self._key(key)
+        with self._lock:
+            return self._entries.pop(key, _ABSENT) is not _ABSENT
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -16,6 +16,13 @@ class LoggerPort(ABC):
         """Set the same debug level to all the project dependencies."""
         raise NotImplementedError
 
+    def is_enabled_for(self, level="DEBUG") -> bool:
+        """
+        Check whether messages of the given level would be emitted, so that callers
+        can skip building expensive messages. Loggers that cannot tell return True.
+        """
+        return True
+
     @abstractmethod
     def debug(self, msg):
         """Logs a DEBUG message"""
@@ -1,5 +1,7 @@
 """Settings module for Edge Mining application."""
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 # Using pydantic-settings for easy environment variable loading
@@ -31,4 +33,11 @@ class AppSettings(BaseSettings):
         env_file=".env",  # Load .env file if exists
         env_file_encoding="utf-8",
         extra="ignore",  # Ignore extra fields from env
+        frozen=True,  # Shared by every service, so it must not be changed after loading
     )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> AppSettings:
+    """Return the application settings, reading the environment and the .env file only once."""
+    return AppSettings()
@@ -0,0 +1,140 @@
+"""Unit tests for the forecast provider API router."""
+
+import uuid
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from edge_mining.adapters.domain.forecast.fast_api.router import router
+from edge_mining.adapters.infrastructure.api.setup import get_config_service
+from edge_mining.application.interfaces import ConfigurationServiceInterface
+from edge_mining.domain.forecast.common import ForecastProviderAdapter
+from edge_mining.domain.forecast.entities import ForecastProvider
+from edge_mining.shared.adapter_configs.forecast import ForecastProviderDummySolarConfig
+
+
+@pytest.fixture
+def provider():
+    """Fixture providing a dummy solar forecast provider."""
+    return ForecastProvider(
+        name="Dummy Solar",
+        adapter_type=ForecastProviderAdapter.DUMMY_SOLAR,
+        config=ForecastProviderDummySolarConfig(),
+    )
+
+
+@pytest.fixture
+def config_service(provider):
+    """Fixture providing a mock configuration service that knows the provider."""
+    service = Mock(spec=ConfigurationServiceInterface)
+    service.get_forecast_provider.return_value = provider
+    service.update_forecast_provider.side_effect = lambda **kwargs: ForecastProvider(
+        id=kwargs["provider_id"],
+        name=kwargs["name"],
+        adapter_type=kwargs["adapter_type"],
+        config=kwargs["config"],
+    )
+    service.create_forecast_provider.side_effect = lambda **kwargs: ForecastProvider(**kwargs)
+    return service
+
+
+@pytest.fixture
+def client(config_service):
+    """Fixture providing a test client for the router."""
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_config_service] = lambda: config_service
+    return TestClient(app)
+
+
+class TestUpdateForecastProvider:
+    """Test suite for the forecast provider update route."""
+
+    def test_valid_config_is_applied(self, client, config_service, provider):
+        """Test that a valid configuration is validated and passed to the service."""
+        response = client.put(
+            f"/forecast-providers/{provider.id}",
+            json={"name": "Renamed", "config": {"capacity_kwp": "5.5"}},
+        )
+
+        assert response.status_code == 200
+        config = config_service.update_forecast_provider.call_args.kwargs["config"]
+        assert config == ForecastProviderDummySolarConfig(capacity_kwp=5.5)
+
+    def test_unknown_config_key_is_rejected(self, client, config_service, provider):
+        """Test that a configuration key the adapter does not define is a client error."""
+        response = client.put(
+            f"/forecast-providers/{provider.id}",
+            json={"name": "Renamed", "config": {"capacity_kwp": 5.5, "bogus": 1}},
+        )
+
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+        config_service.update_forecast_provider.assert_not_called()
+
+    def test_invalid_config_value_is_unprocessable(self, client, config_service, provider):
+        """Test that a configuration value of the wrong type is reported as 422, not 500."""
+        response = client.put(
+            f"/forecast-providers/{provider.id}",
+            json={"name": "Renamed", "config": {"capacity_kwp": "not a number"}},
+        )
+
+        assert response.status_code == 422
+        config_service.update_forecast_provider.assert_not_called()
+
+    def test_out_of_range_config_value_is_unprocessable(self, client, config_service, provider):
+        """Test that the ranges of the configuration schema are enforced."""
+        response = client.put(
+            f"/forecast-providers/{provider.id}",
+            json={"name": "Renamed", "config": {"efficiency_percent": 150}},
+        )
+
+        assert response.status_code == 422
+        config_service.update_forecast_provider.assert_not_called()
+
+    def test_unknown_provider_is_not_found(self, client, config_service):
+        """Test that updating a missing provider is a 404."""
+        config_service.get_forecast_provider.return_value = None
+
+        response = client.put(f"/forecast-providers/{uuid.uuid4()}", json={"name": "Renamed"})
+
+        assert response.status_code == 404
+
+
+class TestAddForecastProvider:
+    """Test suite for the forecast provider creation route."""
+
+    def test_valid_config_is_applied(self, client, config_service):
+        """Test that a valid configuration is validated and passed to the service."""
+        response = client.post(
+            "/forecast-providers",
+            json={"name": "Dummy Solar", "adapter_type": "dummy_solar", "config": {"capacity_kwp": "3"}},
+        )
+
+        assert response.status_code == 200
+        config = config_service.create_forecast_provider.call_args.kwargs["config"]
+        assert config == ForecastProviderDummySolarConfig(capacity_kwp=3.0)
+
+    def test_unknown_config_key_is_rejected(self, client, config_service):
+        """Test that a configuration key the adapter does not define is a client error."""
+        response = client.post(
+            "/forecast-providers",
+            json={"name": "Dummy Solar", "adapter_type": "dummy_solar", "config": {"capacity_kwp": 3, "bogus": 1}},
+        )
+
+        assert response.status_code == 400
+        assert "bogus" in response.json()["detail"]
+        config_service.create_forecast_provider.assert_not_called()
+
+    @pytest.mark.parametrize("config", [{"capacity_kwp": "not a number"}, {"production_end_hour": 24}])
+    def test_invalid_config_value_is_unprocessable(self, client, config_service, config):
+        """Test that a configuration value of the wrong type or out of range is reported as 422."""
+        response = client.post(
+            "/forecast-providers",
+            json={"name": "Dummy Solar", "adapter_type": "dummy_solar", "config": config},
+        )
+
+        assert response.status_code == 422
+        config_service.create_forecast_provider.assert_not_called()
@@ -0,0 +1,44 @@
+"""Unit tests for the forecast provider schemas."""
+
+import json
+import uuid
+import warnings
+from unittest.mock import Mock
+
+from edge_mining.adapters.domain.forecast.repositories import SqliteForecastProviderRepository
+from edge_mining.adapters.domain.forecast.schemas import ForecastProviderSchema
+from edge_mining.adapters.infrastructure.persistence.sqlite import BaseSqliteRepository
+from edge_mining.domain.common import EntityId
+from edge_mining.domain.forecast.common import ForecastProviderAdapter
+from edge_mining.domain.forecast.entities import ForecastProvider
+from edge_mining.shared.adapter_configs.forecast import ForecastProviderDummySolarConfig
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class TestForecastProviderSchema:
+    """Test suite for building forecast provider responses."""
+
+    def test_serializes_provider_loaded_from_sqlite(self, tmp_path):
+        """Test that a provider whose IDs come back from SQLite as strings serializes without warnings."""
+        logger = Mock(spec=LoggerPort)
+        logger.is_enabled_for.return_value = False
+        repo = SqliteForecastProviderRepository(
+            BaseSqliteRepository(db_path=str(tmp_path / "edgemining.db"), logger=logger)
+        )
+        external_service_id = EntityId(uuid.uuid4())
+        provider = ForecastProvider(
+            name="Dummy Solar",
+            adapter_type=ForecastProviderAdapter.DUMMY_SOLAR,
+            config=ForecastProviderDummySolarConfig(capacity_kwp=5.0),
+            external_service_id=external_service_id,
+        )
+        repo.add(provider)
+        loaded = repo.get_by_id(provider.id)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            payload = json.loads(ForecastProviderSchema.from_model(loaded).model_dump_json())
+
+        assert payload["id"] == str(provider.id)
+        assert payload["external_service_id"] == str(external_service_id)
+        assert payload["config"]["capacity_kwp"] == 5.0
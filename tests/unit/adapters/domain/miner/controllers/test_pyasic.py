@@ -0,0 +1,134 @@
+"""Unit tests for the pyasic miner controller caching and pooling."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from edge_mining.adapters.domain.miner.controllers import pyasic as pyasic_controller
+from edge_mining.adapters.domain.miner.controllers.pyasic import PyASICMinerController, clear_miner_pool
+from edge_mining.domain.common import Watts
+from edge_mining.domain.miner.common import MinerStatus
+from edge_mining.shared.logging.port import LoggerPort
+
+
+class FakeMiner:
+    """Stand-in for a pyasic miner, counting the readings it serves."""
+
+    def __init__(self, hashrate_error: Exception = None, wattage_error: Exception = None):
+        self.hashrate_error = hashrate_error
+        self.wattage_error = wattage_error
+        self.reads = 0
+
+    async def get_hashrate(self):
+        self.reads += 1
+        if self.hashrate_error:
+            raise self.hashrate_error
+        return None
+
+    async def get_wattage(self):
+        self.reads += 1
+        if self.wattage_error:
+            raise self.wattage_error
+        return 3250
+
+    async def is_mining(self):
+        self.reads += 1
+        return True
+
+
+@pytest.fixture(autouse=True)
+def miner_pool():
+    """Fixture isolating the shared miner pool between tests."""
+    clear_miner_pool()
+    yield
+    clear_miner_pool()
+
+
+@pytest.fixture
+def logger():
+    """Fixture providing a mock logger."""
+    mock_logger = Mock(spec=LoggerPort)
+    mock_logger.is_enabled_for.return_value = False
+    return mock_logger
+
+
+@pytest.fixture
+def discovery(monkeypatch):
+    """Fixture replacing pyasic discovery, returning the mock that records the calls."""
+    miner = FakeMiner()
+
+    async def get_miner(ip):
+        return discovery_mock(ip)
+
+    discovery_mock = Mock(return_value=miner)
+    monkeypatch.setattr(pyasic_controller.pyasic, "get_miner", get_miner)
+    return discovery_mock
+
+
+def _controller(logger, **kwargs) -> PyASICMinerController:
+    return PyASICMinerController(ip="192.168.1.10", logger=logger, **kwargs)
+
+
+class TestPyASICMinerController:
+    """Test suite for the metrics cache and the shared miner pool."""
+
+    def test_status_poll_reads_the_miner_once(self, logger, discovery):
+        """Test that the getters of one poll are served by a single refresh."""
+        controller = _controller(logger)
+
+        assert controller.get_miner_status() == MinerStatus.ON
+        assert controller.get_miner_power() == Watts(3250)
+        assert controller.get_miner_hashrate() is None
+
+        assert discovery.call_count == 1
+        assert discovery.return_value.reads == 3
+
+    def test_expired_metrics_reuse_the_discovered_miner(self, logger, discovery):
+        """Test that stale metrics are read again without discovering the miner again."""
+        controller = _controller(logger, metrics_ttl=0)
+
+        controller.get_miner_status()
+        controller.get_miner_status()
+
+        assert discovery.call_count == 1
+        assert discovery.return_value.reads == 6
+
+    def test_controllers_share_the_discovered_miner(self, logger, discovery):
+        """Test that controllers with the same connection settings discover the miner once."""
+        _controller(logger).get_miner_status()
+        _controller(logger).get_miner_status()
+
+        assert discovery.call_count == 1
+
+    def test_cleared_pool_discovers_again(self, logger, discovery):
+        """Test that clearing the pool makes new controllers discover the miner again."""
+        _controller(logger).get_miner_status()
+        clear_miner_pool()
+        _controller(logger).get_miner_status()
+
+        assert discovery.call_count == 2
+
+    def test_failed_reading_keeps_the_others(self, logger, discovery):
+        """Test that a failing reading is logged and reported as missing, keeping the other readings."""
+        discovery.return_value.wattage_error = ConnectionError("timed out")
+        controller = _controller(logger)
+
+        assert controller.get_miner_power() is None
+        assert controller.get_miner_status() == MinerStatus.ON
+
+        logger.warning.assert_called_once()
+        assert "timed out" in logger.warning.call_args.args[0]
+
+    def test_failed_reading_invalidates_the_miner_once(self, logger, discovery, monkeypatch):
+        """Test that failing readings discard the discovered miner once per refresh."""
+        error = ConnectionError("timed out")
+        discovery.return_value = FakeMiner(hashrate_error=error, wattage_error=error)
+        controller = _controller(logger, metrics_ttl=0)
+        invalidate = Mock(wraps=controller.invalidate)
+        monkeypatch.setattr(controller, "invalidate", invalidate)
+
+        controller.refresh()
+        controller.refresh()
+
+        assert invalidate.call_count == 2
+        assert discovery.call_count == 2
@@ -0,0 +1,76 @@
+"""Unit tests for the notifier repositories."""
+
+import uuid
+from unittest.mock import Mock
+
+import pytest
+
+from edge_mining.adapters.domain.notification.repositories import (
+    InMemoryNotifierRepository,
+    SqliteNotifierRepository,
+)
+from edge_mining.adapters.infrastructure.persistence.sqlite import SQLITE_MAX_VARIABLES, BaseSqliteRepository
+from edge_mining.domain.common import EntityId
+from edge_mining.domain.notification.entities import Notifier
+from edge_mining.shared.adapter_configs.notification import DummyNotificationConfig
+from edge_mining.shared.logging.port import LoggerPort
+
+
+@pytest.fixture
+def logger():
+    """Fixture providing a mock logger."""
+    mock_logger = Mock(spec=LoggerPort)
+    mock_logger.is_enabled_for.return_value = False
+    return mock_logger
+
+
+@pytest.fixture(params=["in_memory", "sqlite"])
+def notifier_repo(request, tmp_path, logger):
+    """Fixture providing each notifier repository implementation."""
+    if request.param == "in_memory":
+        return InMemoryNotifierRepository()
+    return SqliteNotifierRepository(BaseSqliteRepository(db_path=str(tmp_path / "edgemining.db"), logger=logger))
+
+
+def _add_notifiers(repo, count: int):
+    notifiers = [Notifier(name=f"notifier-{i}", config=DummyNotificationConfig()) for i in range(count)]
+    for notifier in notifiers:
+        repo.add(notifier)
+    return notifiers
+
+
+class TestNotifierRepositoryGetByIds:
+    """Test suite for retrieving several notifiers at once."""
+
+    def test_returns_requested_notifiers(self, notifier_repo):
+        """Test that only the requested notifiers are returned, keyed by the requested IDs."""
+        notifiers = _add_notifiers(notifier_repo, 3)
+        requested = [EntityId(uuid.UUID(str(notifiers[2].id))), EntityId(uuid.UUID(str(notifiers[0].id)))]
+
+        result = notifier_repo.get_by_ids(requested)
+
+        assert set(result) == set(requested)
+        assert result[requested[0]].name == "notifier-2"
+        assert result[requested[1]].name == "notifier-0"
+
+    def test_missing_ids_are_skipped(self, notifier_repo):
+        """Test that IDs without a notifier are left out of the result."""
+        _add_notifiers(notifier_repo, 2)
+
+        assert notifier_repo.get_by_ids([EntityId(uuid.uuid4())]) == {}
+        assert notifier_repo.get_by_ids([]) == {}
+
+    def test_sqlite_batches_beyond_variable_limit(self, tmp_path, logger):
+        """Test that more IDs than SQLite accepts in one query are fetched across batches."""
+        repo = SqliteNotifierRepository(BaseSqliteRepository(db_path=str(tmp_path / "edgemining.db"), logger=logger))
+        notifiers = _add_notifiers(repo, SQLITE_MAX_VARIABLES + 200)
+        requested = [EntityId(uuid.UUID(str(notifier.id))) for notifier in reversed(notifiers)]
+        requested.insert(SQLITE_MAX_VARIABLES // 2, EntityId(uuid.uuid4()))
+
+        result = repo.get_by_ids(requested)
+
+        assert len(requested) > 999
+        assert len(result) == len(notifiers)
+        assert [result[notifier_id].name for notifier_id in requested if notifier_id in result] == [
+            notifier.name for notifier in reversed(notifiers)
+        ]
@@ -0,0 +1,73 @@
+"""Unit tests for the FastAPI router utilities."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from edge_mining.adapters.infrastructure.api.utils import map_exceptions
+
+
+class NotFoundError(Exception):
+    """Exception mapped to 404 in the tests."""
+
+
+class SpecificNotFoundError(NotFoundError):
+    """Subclass of a mapped exception."""
+
+
+def _raising(exception: Exception):
+    """Build a decorated async handler that raises exception."""
+
+    @map_exceptions({NotFoundError: 404, ValueError: 400})
+    async def handler() -> None:
+        raise exception
+
+    return handler
+
+
+class TestMapExceptions:
+    """Test suite for the map_exceptions decorator."""
+
+    def test_returns_handler_result(self):
+        """Test that the handler result is returned untouched."""
+
+        @map_exceptions({ValueError: 400})
+        async def handler(value: int) -> int:
+            return value * 2
+
+        assert asyncio.run(handler(21)) == 42
+
+    def test_http_exception_passes_through(self):
+        """Test that an HTTPException raised by the handler is not remapped."""
+        original = HTTPException(status_code=409, detail="conflict")
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(_raising(original)())
+
+        assert exc_info.value is original
+
+    @pytest.mark.parametrize(
+        "exception, status_code",
+        [
+            (NotFoundError("missing"), 404),
+            (SpecificNotFoundError("missing"), 404),
+            (ValueError("bad input"), 400),
+        ],
+    )
+    def test_mapped_exception_gets_its_status(self, exception, status_code):
+        """Test that mapped exceptions, and their subclasses, get the mapped status code."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(_raising(exception)())
+
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail == str(exception)
+        assert exc_info.value.__cause__ is exception
+
+    def test_unmapped_exception_becomes_500(self):
+        """Test that any other exception becomes a 500 response."""
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(_raising(RuntimeError("boom"))())
+
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "boom"
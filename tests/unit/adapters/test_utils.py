@@ -0,0 +1,87 @@
+"""Unit tests for the adapters utility functions."""
+
+import asyncio
+import contextvars
+
+import pytest
+
+from edge_mining.adapters.utils import STRICT_ASYNC_ENV_VAR, run_async_func
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+async def _double(value: int) -> int:
+    await asyncio.sleep(0)
+    return value * 2
+
+
+async def _fail() -> None:
+    await asyncio.sleep(0)
+    raise ValueError("boom")
+
+
+async def _read_request_id() -> str:
+    return request_id.get()
+
+
+class TestRunAsyncFunc:
+    """Test suite for running coroutines from synchronous code."""
+
+    def test_returns_coroutine_result(self):
+        """Test that the coroutine result is returned to the caller."""
+        assert run_async_func(_double(21)) == 42
+
+    def test_repeated_calls_reuse_the_loop(self):
+        """Test that consecutive calls keep working on the shared background loop."""
+        assert [run_async_func(_double(i)) for i in range(5)] == [0, 2, 4, 6, 8]
+
+    def test_accepts_plain_awaitables(self):
+        """Test that awaitables which are not coroutines are run too."""
+
+        class Awaitable:
+            def __await__(self):
+                return _double(5).__await__()
+
+        assert run_async_func(Awaitable()) == 10
+
+    def test_propagates_exceptions(self):
+        """Test that an exception raised by the coroutine is raised to the caller."""
+        with pytest.raises(ValueError, match="boom"):
+            run_async_func(_fail())
+
+    def test_context_variables_are_visible(self):
+        """Test that the coroutine sees the context variables set by the caller."""
+        token = request_id.set("abc")
+        try:
+            assert run_async_func(_read_request_id()) == "abc"
+        finally:
+            request_id.reset(token)
+
+    def test_call_from_background_loop_raises(self):
+        """Test that calling it from a coroutine on its own loop raises instead of deadlocking."""
+
+        async def nested() -> int:
+            return run_async_func(_double(1))
+
+        with pytest.raises(RuntimeError, match="background event loop"):
+            run_async_func(nested())
+
+    def test_call_from_running_loop_warns(self, monkeypatch):
+        """Test that calling it from a thread running an event loop warns, but still works."""
+        monkeypatch.delenv(STRICT_ASYNC_ENV_VAR, raising=False)
+
+        async def caller() -> int:
+            return run_async_func(_double(4))
+
+        with pytest.warns(RuntimeWarning, match="blocks it"):
+            assert asyncio.run(caller()) == 8
+
+    def test_call_from_running_loop_raises_in_strict_mode(self, monkeypatch):
+        """Test that calling it from a thread running an event loop raises in strict mode."""
+        monkeypatch.setenv(STRICT_ASYNC_ENV_VAR, "1")
+
+        async def caller() -> int:
+            return run_async_func(_double(4))
+
+        with pytest.raises(RuntimeError, match="blocks it"):
+            asyncio.run(caller())
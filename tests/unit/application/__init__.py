@@ -0,0 +1 @@
+"""Collection of unit tests for the application layer."""
@@ -0,0 +1,92 @@
+"""Shared fixtures for application service tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from edge_mining.adapters.domain.energy.repositories import (
+    InMemoryEnergyMonitorRepository,
+    InMemoryEnergySourceRepository,
+)
+from edge_mining.adapters.domain.forecast.repositories import SqliteForecastProviderRepository
+from edge_mining.adapters.domain.home_load.repositories import (
+    InMemoryHomeForecastProviderRepository,
+    InMemoryHomeLoadsProfileRepository,
+)
+from edge_mining.adapters.domain.miner.repositories import (
+    InMemoryMinerControllerRepository,
+    InMemoryMinerRepository,
+)
+from edge_mining.adapters.domain.notification.repositories import SqliteNotifierRepository
+from edge_mining.adapters.domain.optimization_unit.repositories import InMemoryOptimizationUnitRepository
+from edge_mining.adapters.domain.performance.repositories import InMemoryMiningPerformanceTrackerRepository
+from edge_mining.adapters.domain.policy.repositories import InMemoryOptimizationPolicyRepository
+from edge_mining.adapters.domain.user.repositories import InMemorySettingsRepository
+from edge_mining.adapters.infrastructure.external_services.repositories import SqliteExternalServiceRepository
+from edge_mining.adapters.infrastructure.persistence.sqlite import BaseSqliteRepository
+from edge_mining.application.services.adapter_service import AdapterService
+from edge_mining.application.services.configuration_service import ConfigurationService
+from edge_mining.shared.infrastructure import PersistenceSettings
+from edge_mining.shared.logging.port import LoggerPort
+
+
+@pytest.fixture
+def logger():
+    """Fixture providing a mock logger."""
+    mock_logger = Mock(spec=LoggerPort)
+    mock_logger.is_enabled_for.return_value = False
+    return mock_logger
+
+
+@pytest.fixture
+def sqlite_db(tmp_path, logger):
+    """Fixture providing a SQLite database in a temporary directory."""
+    return BaseSqliteRepository(db_path=str(tmp_path / "edgemining.db"), logger=logger)
+
+
+@pytest.fixture
+def persistence_settings(sqlite_db):
+    """
+    Fixture providing the repositories. Forecast providers, notifiers and external
+    services are stored in SQLite, which hands IDs back as strings.
+    """
+    return PersistenceSettings(
+        energy_source_repo=InMemoryEnergySourceRepository(),
+        energy_monitor_repo=InMemoryEnergyMonitorRepository(),
+        miner_repo=InMemoryMinerRepository(),
+        miner_controller_repo=InMemoryMinerControllerRepository(),
+        forecast_provider_repo=SqliteForecastProviderRepository(sqlite_db),
+        home_profile_repo=InMemoryHomeLoadsProfileRepository(),
+        home_forecast_provider_repo=InMemoryHomeForecastProviderRepository(),
+        policy_repo=InMemoryOptimizationPolicyRepository(),
+        mining_performance_tracker_repo=InMemoryMiningPerformanceTrackerRepository(),
+        optimization_unit_repo=InMemoryOptimizationUnitRepository(),
+        notifier_repo=SqliteNotifierRepository(sqlite_db),
+        external_service_repo=SqliteExternalServiceRepository(sqlite_db),
+        settings_repo=InMemorySettingsRepository(),
+    )
+
+
+@pytest.fixture
+def adapter_service(persistence_settings, logger):
+    """Fixture providing an AdapterService over the test repositories."""
+    return AdapterService(
+        energy_monitor_repo=persistence_settings.energy_monitor_repo,
+        miner_controller_repo=persistence_settings.miner_controller_repo,
+        notifier_repo=persistence_settings.notifier_repo,
+        forecast_provider_repo=persistence_settings.forecast_provider_repo,
+        mining_performance_tracker_repo=persistence_settings.mining_performance_tracker_repo,
+        home_forecast_provider_repo=persistence_settings.home_forecast_provider_repo,
+        external_service_repo=persistence_settings.external_service_repo,
+        logger=logger,
+    )
+
+
+@pytest.fixture
+def config_service(persistence_settings, logger, adapter_service):
+    """Fixture providing a ConfigurationService that invalidates the adapter service caches."""
+    return ConfigurationService(
+        persistence_settings=persistence_settings,
+        logger=logger,
+        adapter_service=adapter_service,
+    )
@@ -0,0 +1,113 @@
+"""Unit tests for AdapterService adapter caching."""
+
+import uuid
+
+from edge_mining.domain.common import EntityId, Watts
+from edge_mining.domain.energy.common import EnergySourceType
+from edge_mining.domain.energy.entities import EnergySource
+from edge_mining.domain.forecast.common import ForecastProviderAdapter
+from edge_mining.domain.notification.entities import Notifier
+from edge_mining.shared.adapter_configs.forecast import ForecastProviderDummySolarConfig
+from edge_mining.shared.adapter_configs.notification import DummyNotificationConfig
+
+
+def _create_solar_source(config_service):
+    """Create a dummy solar forecast provider and an energy source using it."""
+    provider = config_service.create_forecast_provider(
+        name="Dummy Solar",
+        adapter_type=ForecastProviderAdapter.DUMMY_SOLAR,
+        config=ForecastProviderDummySolarConfig(capacity_kwp=5.0),
+    )
+    energy_source = EnergySource(
+        name="Solar",
+        type=EnergySourceType.SOLAR,
+        nominal_power_max=Watts(5000),
+        forecast_provider_id=provider.id,
+    )
+    return provider, energy_source
+
+
+class TestAdapterServiceCacheInvalidation:
+    """Test suite for the invalidation of cached adapters on configuration changes."""
+
+    def test_adapter_is_cached(self, adapter_service, config_service):
+        """Test that the same adapter instance is returned while nothing changes."""
+        _, energy_source = _create_solar_source(config_service)
+
+        first = adapter_service.get_forecast_provider(energy_source)
+
+        assert first is not None
+        assert adapter_service.get_forecast_provider(energy_source) is first
+
+    def test_update_rebuilds_adapter(self, adapter_service, config_service):
+        """Test that updating a provider with a UUID ID drops the adapter cached under its string ID."""
+        provider, energy_source = _create_solar_source(config_service)
+        first = adapter_service.get_forecast_provider(energy_source)
+
+        config_service.update_forecast_provider(
+            provider_id=EntityId(uuid.UUID(str(provider.id))),
+            name="Dummy Solar",
+            adapter_type=ForecastProviderAdapter.DUMMY_SOLAR,
+            config=ForecastProviderDummySolarConfig(capacity_kwp=10.0),
+        )
+        second = adapter_service.get_forecast_provider(energy_source)
+
+        assert second is not None
+        assert second is not first
+
+    def test_invalidate_matches_uuid_and_string_ids(self, adapter_service, config_service):
+        """Test that an adapter cached under a string ID is invalidated through its UUID."""
+        provider, energy_source = _create_solar_source(config_service)
+        first = adapter_service.get_forecast_provider(energy_source)
+
+        adapter_service.invalidate(EntityId(uuid.UUID(str(provider.id))))
+
+        assert adapter_service.get_forecast_provider(energy_source) is not first
+
+    def test_removed_provider_returns_none(self, adapter_service, config_service):
+        """Test that no adapter is returned once the provider has been removed."""
+        provider, energy_source = _create_solar_source(config_service)
+        assert adapter_service.get_forecast_provider(energy_source) is not None
+
+        config_service.remove_forecast_provider(EntityId(uuid.UUID(str(provider.id))))
+
+        assert adapter_service.get_forecast_provider(energy_source) is None
+
+    def test_provider_removed_outside_configuration_service_returns_none(
+        self, adapter_service, config_service, persistence_settings
+    ):
+        """Test that the repository is checked even when the adapter is cached."""
+        provider, energy_source = _create_solar_source(config_service)
+        assert adapter_service.get_forecast_provider(energy_source) is not None
+
+        persistence_settings.forecast_provider_repo.remove(provider.id)
+
+        assert adapter_service.get_forecast_provider(energy_source) is None
+
+
+class TestAdapterServiceGetNotifiers:
+    """Test suite for retrieving several notifier adapters at once."""
+
+    def test_notifier_adapters_are_cached(self, adapter_service, persistence_settings):
+        """Test that the same notifier adapters are returned while nothing changes."""
+        notifier = Notifier(name="Dummy", config=DummyNotificationConfig())
+        persistence_settings.notifier_repo.add(notifier)
+
+        first = adapter_service.get_notifiers([notifier.id])
+
+        assert len(first) == 1
+        assert adapter_service.get_notifiers([EntityId(uuid.UUID(str(notifier.id)))])[0] is first[0]
+
+    def test_returns_adapters_in_requested_order(self, adapter_service, persistence_settings, monkeypatch):
+        """Test that adapters follow the requested order across SQLite batches, skipping missing IDs."""
+        notifiers = [Notifier(name=f"notifier-{i}", config=DummyNotificationConfig()) for i in range(1200)]
+        for notifier in notifiers:
+            persistence_settings.notifier_repo.add(notifier)
+        requested = [EntityId(uuid.UUID(str(notifier.id))) for notifier in reversed(notifiers)]
+        requested.insert(500, EntityId(uuid.uuid4()))
+        # Stand in for the adapter, so that the result shows which notifier each entry was built from
+        monkeypatch.setattr(type(adapter_service), "_initialize_notifier_adapter", lambda _, notifier: notifier.name)
+
+        result = adapter_service.get_notifiers(requested)
+
+        assert result == [notifier.name for notifier in reversed(notifiers)]
@@ -0,0 +1,106 @@
+"""Unit tests for BoundedCache."""
+
+import uuid
+
+from edge_mining.shared.cache import BoundedCache
+
+
+class TestBoundedCache:
+    """Test suite for BoundedCache."""
+
+    def test_get_returns_default_when_missing(self):
+        """Test that a missing key returns the given default."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+        sentinel = object()
+
+        assert cache.get("missing") is None
+        assert cache.get("missing", sentinel) is sentinel
+
+    def test_evicts_least_recently_stored_entry(self):
+        """Test that storing beyond maxsize evicts the oldest entry."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["c"] = 3
+
+        assert "a" not in cache
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_get_marks_entry_as_recently_used(self):
+        """Test that reading an entry protects it from the next eviction."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+
+        cache["a"] = 1
+        cache["b"] = 2
+        cache.get("a")
+        cache["c"] = 3
+
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_get_marks_entry_equal_to_default_as_recently_used(self):
+        """Test that a stored value equal to the default still refreshes the LRU order."""
+        cache: BoundedCache[str, None] = BoundedCache(maxsize=2)
+
+        cache["a"] = None
+        cache["b"] = None
+        assert cache.get("a") is None
+        cache["c"] = None
+
+        assert "a" in cache
+        assert "b" not in cache
+
+    def test_overwrite_marks_entry_as_recently_used(self):
+        """Test that storing an existing key moves it to the most recent position."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+
+        cache["a"] = 1
+        cache["b"] = 2
+        cache["a"] = 10
+        cache["c"] = 3
+
+        assert cache.get("a") == 10
+        assert "b" not in cache
+
+    def test_invalidate(self):
+        """Test that invalidate removes the entry and reports whether it was cached."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=2)
+        cache["a"] = 1
+
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        assert "a" not in cache
+
+    def test_invalidate_entry_holding_none(self):
+        """Test that an entry storing None is still reported as cached."""
+        cache: BoundedCache[str, None] = BoundedCache(maxsize=2)
+        cache["a"] = None
+
+        assert cache.invalidate("a") is True
+
+    def test_pop_and_clear(self):
+        """Test removing a single entry and every entry."""
+        cache: BoundedCache[str, int] = BoundedCache(maxsize=3)
+        cache["a"] = 1
+        cache["b"] = 2
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a", "gone") == "gone"
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_key_function_normalizes_keys(self):
+        """Test that keys passed through the key function address the same entry."""
+        cache: BoundedCache[object, str] = BoundedCache(maxsize=2, key=str)
+        entity_id = uuid.uuid4()
+
+        cache[str(entity_id)] = "adapter"
+
+        assert cache.get(entity_id) == "adapter"
+        assert entity_id in cache
+        assert cache.invalidate(entity_id) is True
+        assert str(entity_id) not in cache